@@ -0,0 +1,232 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Name:     ColumnCache.py
+# Version:  1.0.0
+# Author:   Glenn Abastillas
+# Date:     October 18, 2026
+#
+# Purpose: Allows the user to:
+#           1.) Save the parsed columns of a spreadsheet file next to it in a
+#               compact binary file.
+#           2.) Reload the columns from that file without parsing the
+#               spreadsheet again, as long as the spreadsheet is unchanged.
+#
+# This class is used in the following classes:
+#       - Spreadsheet.py
+# - - - - - - - - - - - - -
+"""
+    ColumnCache stores spreadsheet columns in a binary sidecar file. Columns
+    with few distinct cells are dictionary encoded: the distinct cells are
+    stored once and each row holds a small integer code in an array. Other
+    columns, e.g., ids and measurements, are stored as plain lists, which
+    marshal reads back faster than codes can be decoded. A cache is fresh
+    only if the path, size and modification time of its spreadsheet file,
+    and the delimiter and quoting used to parse it, are unchanged.
+"""
+
+__author__ = "Glenn Abastillas"
+__copyright__ = "Copyright (c) October 18, 2026"
+__credits__ = "Glenn Abastillas"
+
+__license__ = "Free"
+__version__ = "1.0.0"
+__maintainer__ = "Glenn Abastillas"
+
+from array import array
+import marshal
+import os
+import sys
+
+
+class ColumnCache(object):
+
+    """
+        ColumnCache reads and writes the columns of a spreadsheet file.
+
+        File layout: the MAGIC line, a marshalled dict describing the source
+        file, the number of columns, then one marshalled tuple per column:
+        (cells, typecode, codes) for a dictionary encoded column, or
+        (cells,) for a plain one.
+
+        User Accesible Methods:
+
+            path(filePath (str))
+                --> Gets the default cache location for a spreadsheet file.
+
+            read(cachePath (str), filePath (str), delimiter (str),
+                 quoted (bool))
+                --> Gets the cached columns, or None if the cache is missing
+                    or stale.
+
+            write(cachePath (str), filePath (str), delimiter (str),
+                  columns (list), quoted (bool))
+                --> Writes columns to the cache.
+    """
+
+    MAGIC = "PYDOCS-COLUMNS 2\n"
+    SUFFIX = ".columns"
+
+    # A column is dictionary encoded if it has at most 1 distinct cell per
+    # DISTINCT rows, and few enough distinct cells for 'H' codes. The first
+    # SAMPLE cells are checked first, so unique columns are never hashed
+    # in full.
+    DISTINCT = 4
+    SAMPLE = 10000
+
+    @staticmethod
+    def path(filePath):
+        """
+            Get the default cache location for a spreadsheet file
+
+            Attributes:
+                filePath (str): spreadsheet file
+
+            Returns:
+                str: filePath with SUFFIX added
+        """
+        return filePath + ColumnCache.SUFFIX
+
+    @staticmethod
+    def repetitive(cells, distinct=None):
+        """
+            Check if cells repeat enough to be dictionary encoded
+
+            Attributes:
+                cells (list): cells of a column, or a sample of them
+                distinct (set): distinct cells, found from cells if None
+
+            Returns:
+                bool: True if there is at most one distinct cell per
+                      DISTINCT cells
+        """
+        if distinct is None:
+            distinct = set(cells)
+
+        return len(distinct) * ColumnCache.DISTINCT <= len(cells)
+
+    @staticmethod
+    def source(filePath, delimiter, quoted=False):
+        """
+            Describe a spreadsheet file for checking that a cache is fresh
+
+            Attributes:
+                filePath (str): spreadsheet file
+                delimiter (str): delimiter used to parse it
+                quoted (bool): True if quoted cells were parsed
+
+            Returns:
+                dict: path, size, modification time, delimiter, quoting and
+                      byte order
+        """
+        status = os.stat(filePath)
+
+        return {"path": os.path.abspath(filePath),
+                "size": status.st_size,
+                "mtime": status.st_mtime,
+                "delimiter": delimiter,
+                "quoted": quoted,
+                "byteorder": sys.byteorder}
+
+    @staticmethod
+    def read(cachePath, filePath, delimiter="\t", quoted=False):
+        """
+            Read the columns of a spreadsheet file from its cache
+
+            Attributes:
+                cachePath (str): cache file
+                filePath (str): spreadsheet file the cache was written for
+                delimiter (str): delimiter used to parse filePath
+                quoted (bool): True if quoted cells are parsed
+
+            Returns:
+                list: column lists, header first
+                None: if the cache is missing, unreadable or stale
+        """
+        try:
+            with open(cachePath, 'rb') as fileIn:
+                if fileIn.readline() != ColumnCache.MAGIC:
+                    return None
+
+                if marshal.load(fileIn) != ColumnCache.source(filePath,
+                                                              delimiter,
+                                                              quoted):
+                    return None
+
+                count = marshal.load(fileIn)
+                columns = list()
+
+                for i in xrange(count):
+                    encoded = marshal.load(fileIn)
+
+                    if len(encoded) == 1:
+                        columns.append(encoded[0])
+                    else:
+                        cells, typecode, codes = encoded
+                        codes = array(typecode, codes)
+                        columns.append(map(cells.__getitem__, codes))
+
+                return columns
+
+        except (IOError, OSError, EOFError, ValueError, TypeError):
+            return None
+
+    @staticmethod
+    def write(cachePath, filePath, delimiter, columns, quoted=False):
+        """
+            Write the columns of a spreadsheet file to its cache. The cache
+            is written to a temporary file first, then renamed, so readers
+            never see a partial cache. Failure to write is ignored; the
+            cache is only an optimization.
+
+            Attributes:
+                cachePath (str): cache file
+                filePath (str): spreadsheet file the columns were parsed from
+                delimiter (str): delimiter used to parse filePath
+                columns (list): column lists, header first
+                quoted (bool): True if quoted cells were parsed
+
+            Returns:
+                bool: True if the cache was written
+        """
+        temporaryPath = "{0}.{1}.tmp".format(cachePath, os.getpid())
+
+        try:
+            with open(temporaryPath, 'wb') as fileOut:
+                fileOut.write(ColumnCache.MAGIC)
+                marshal.dump(ColumnCache.source(filePath, delimiter, quoted),
+                             fileOut)
+                marshal.dump(len(columns), fileOut)
+
+                for column in columns:
+                    if not isinstance(column, list):
+                        column = list(column)
+
+                    cells = None
+
+                    if ColumnCache.repetitive(column[:ColumnCache.SAMPLE]):
+                        cells = set(column)
+
+                    # Unique-ish columns are stored as they are
+                    if (cells is None or len(cells) > 0xFFFF or
+                            not ColumnCache.repetitive(column, cells)):
+                        marshal.dump((column,), fileOut)
+                        continue
+
+                    cells = list(cells)
+                    codes = dict((cell, i) for i, cell in enumerate(cells))
+
+                    # Use the smallest integer type that can hold every code
+                    typecode = 'B' if len(cells) <= 0xFF else 'H'
+
+                    encoded = array(typecode, map(codes.__getitem__, column))
+                    marshal.dump((cells, typecode, encoded.tostring()),
+                                 fileOut)
+
+            os.rename(temporaryPath, cachePath)
+            return True
+
+        except (IOError, OSError, ValueError):
+            if os.path.exists(temporaryPath):
+                os.remove(temporaryPath)
+            return False
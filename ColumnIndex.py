@@ -0,0 +1,258 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Name:     ColumnIndex.py
+# Version:  1.0.0
+# Author:   Glenn Abastillas
+# Date:     October 18, 2026
+#
+# Purpose: Allows the user to:
+#           1.) Find the rows holding a value in a column without scanning
+#               the column.
+#           2.) Find the rows whose values fall in a range or start with a
+#               prefix.
+#
+# This class is used in the following classes:
+#       - Spreadsheet.py
+#       - MappedSpreadsheet.py
+# - - - - - - - - - - - - -
+"""
+    HashIndex maps each value of a column to the rows holding it. SortedIndex
+    keeps the values of a column in order for range and prefix queries. Both
+    skip the header row and give rows by their index in the spreadsheet.
+"""
+
+__author__ = "Glenn Abastillas"
+__copyright__ = "Copyright (c) October 18, 2026"
+__credits__ = "Glenn Abastillas"
+
+__license__ = "Free"
+__version__ = "1.0.0"
+__maintainer__ = "Glenn Abastillas"
+
+from array import array
+from bisect import bisect_left, bisect_right
+
+
+class HashIndex(object):
+
+    """
+        HashIndex finds the rows holding an exact value in constant time.
+
+        User Accesible Methods:
+
+            add(value (str), row (int))
+                --> Adds a row to the index.
+
+            find(value (str))
+                --> Gets the rows holding value, in row order.
+    """
+
+    def __init__(self, cells):
+        """
+            Initializes an instance of this class
+
+            Attributes:
+                cells (list): cells of the column, including the header
+        """
+        self.rows = dict()
+        rows = self.rows
+
+        for i in xrange(1, len(cells)):
+            value = cells[i]
+
+            if value in rows:
+                rows[value].append(i)
+            else:
+                rows[value] = array('l', [i])
+
+    def add(self, value, row):
+        """
+            Add a row to the index. Rows must be added in increasing order.
+
+            Attributes:
+                value (str): cell of the row in the indexed column
+                row (int): index of the row
+        """
+        if value in self.rows:
+            self.rows[value].append(row)
+        else:
+            self.rows[value] = array('l', [row])
+
+    def find(self, value):
+        """
+            Get the rows holding a value
+
+            Attributes:
+                value (str): value to look up
+
+            Returns:
+                list: indices of matching rows, in row order
+        """
+        return list(self.rows.get(value, ()))
+
+
+class SortedIndex(object):
+
+    """
+        SortedIndex finds the rows in a range of values, or starting with a
+        prefix, in logarithmic time plus the number of rows found. Blank
+        cells are left out.
+
+        collation is 'number' or 'text'. Numeric indices compare cells as
+        floats and leave out cells that are not numbers; text indices
+        compare cells as strings.
+
+        Added rows are buffered and merged into the sorted keys in one pass
+        when the index is next queried, so adding n rows one at a time costs
+        O(n) per query that follows them, not O(n) per row.
+
+        User Accesible Methods:
+
+            add(value (str), row (int))
+                --> Adds a row to the index.
+
+            flush()
+                --> Merges the added rows into the sorted keys.
+
+            find(value (str))
+                --> Gets the rows equal to value.
+
+            range(low (str, float), high (str, float))
+                --> Gets the rows with low <= value <= high.
+
+            prefix(prefix (str))
+                --> Gets the rows whose value starts with prefix.
+    """
+
+    NUMBER = "number"
+    TEXT = "text"
+
+    def __init__(self, cells, collation=None):
+        """
+            Initializes an instance of this class
+
+            Attributes:
+                cells (list): cells of the column, including the header
+                collation (str): 'number' or 'text'
+        """
+        self.collation = collation or self.TEXT
+        key = self.key
+
+        pairs = [(key(cells[i]), i) for i in xrange(1, len(cells))]
+        pairs = sorted(pair for pair in pairs if pair[0] is not None)
+
+        self.keys = [key for key, row in pairs]
+        self.rows = array('l', (row for key, row in pairs))
+
+        # (key, row) pairs added since the keys were last sorted
+        self.pending = list()
+
+    def add(self, value, row):
+        """
+            Add a row to the index. Rows must be added in increasing order.
+
+            Attributes:
+                value (str): cell of the row in the indexed column
+                row (int): index of the row
+        """
+        key = self.key(value)
+
+        if key is not None:
+            self.pending.append((key, row))
+
+    def convert(self, value):
+        """
+            Get the key a value is sorted by
+
+            Raises:
+                ValueError: if this is a numeric index and value is not a
+                            number
+        """
+        if self.collation == self.NUMBER:
+            return float(value)
+        return value
+
+    def flush(self):
+        """
+            Merge the rows added since the last query into the sorted keys
+        """
+        if not self.pending:
+            return
+
+        # Both runs are sorted, so sorted() merges them in linear time
+        pairs = sorted(zip(self.keys, self.rows) + sorted(self.pending))
+
+        self.keys = [key for key, row in pairs]
+        self.rows = array('l', (row for key, row in pairs))
+        self.pending = list()
+
+    def key(self, value):
+        """
+            Get the key a cell is sorted by, or None if the cell is blank or,
+            in a numeric index, not a number
+        """
+        if value == "":
+            return None
+
+        try:
+            return self.convert(value)
+        except(ValueError, TypeError):
+            return None
+
+    def find(self, value):
+        """
+            Get the rows equal to a value
+
+            Attributes:
+                value (str, float): value to look up
+
+            Returns:
+                list: indices of matching rows, in row order
+        """
+        return self.range(value, value)
+
+    def prefix(self, prefix):
+        """
+            Get the rows whose value starts with a prefix
+
+            Attributes:
+                prefix (str): start of the values to find
+
+            Returns:
+                list: indices of matching rows, in order of value
+
+            Raises:
+                ValueError: if this is a numeric index
+        """
+        if self.collation == self.NUMBER:
+            raise ValueError("Prefix queries need a text index")
+
+        self.flush()
+        keys = self.keys
+        start = bisect_left(keys, prefix)
+        end = start
+
+        while end < len(keys) and keys[end].startswith(prefix):
+            end += 1
+
+        return list(self.rows[start:end])
+
+    def range(self, low=None, high=None):
+        """
+            Get the rows with values from low to high, inclusive
+
+            Attributes:
+                low (str, float): smallest value to find, None for no limit
+                high (str, float): largest value to find, None for no limit
+
+            Returns:
+                list: indices of matching rows, in order of value
+        """
+        self.flush()
+        keys = self.keys
+        start = 0 if low is None else bisect_left(keys, self.convert(low))
+        end = len(keys) if high is None else bisect_right(keys,
+                                                          self.convert(high))
+
+        return list(self.rows[start:end])
@@ -0,0 +1,1109 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Name:     ColumnStore.py
+# Version:  1.0.0
+# Author:   Glenn Abastillas
+# Date:     October 18, 2026
+#
+# Purpose: Allows the user to:
+#           1.) Store a table as a fixed list of columns.
+#           2.) Access the same data as rows through views that read and
+#               write the underlying columns without copying them.
+#           3.) View any list of lists with its rows and columns swapped.
+#
+# This class is used in the following classes:
+#       - Spreadsheet.py
+# - - - - - - - - - - - - -
+"""
+    ColumnStore keeps spreadsheet data in one fixed, columnar layout. Rows are
+    served as RowView objects that map onto the columns, so switching between
+    row and column access never copies the table.
+"""
+
+__author__ = "Glenn Abastillas"
+__copyright__ = "Copyright (c) October 18, 2026"
+__credits__ = "Glenn Abastillas"
+
+__license__ = "Free"
+__version__ = "1.0.0"
+__maintainer__ = "Glenn Abastillas"
+
+from itertools import chain, izip, izip_longest, repeat
+
+
+class ColumnStore(object):
+
+    """
+        ColumnStore holds a table as a list of column lists. Columns may be
+        shorter than the longest column; views read the missing cells as ""
+        and row edits pad only the columns they touch, so single edits never
+        walk every column. normalize() pads the rest when it is called.
+
+        User Accesible Methods:
+
+            appendColumn(values (list))
+                --> Adds a column, padding it to the current row count.
+
+            appendRow(values (list))
+                --> Adds a row, adding columns if the row is wider.
+
+            appendColumns(new_columns (list))
+                --> Adds a block of rows given as columns.
+
+            appendRows(rows (iterable))
+                --> Adds many rows at once, column by column.
+
+            column(column (int))
+                --> Gets a ColumnView over the specified column.
+
+            columnsView()
+                --> Gets a ColumnsView over all columns.
+
+            deleteColumn(column (int))
+                --> Removes a column.
+
+            deleteRow(row (int))
+                --> Removes a row from every column.
+
+            insertRow(row (int), values (list))
+                --> Inserts a row before the specified index.
+
+            normalize()
+                --> Pads short columns so all columns are the same length.
+
+            padColumn(column (int), length (int))
+                --> Pads one column to at least the specified length.
+
+            row(row (int))
+                --> Gets a RowView over the specified row.
+
+            rows()
+                --> Gets a RowsView over all rows.
+
+            setColumns(columns (list)), setRows(rows (iterable))
+                --> Replaces all data in the store.
+    """
+
+    def __init__(self, columns=None):
+        """
+            Initializes an instance of this class
+
+            Attributes:
+                columns (list): list of column lists to store
+        """
+        if columns is None:
+            columns = list()
+
+        self.columns = columns
+
+        # incremented whenever data is changed through the store or its views
+        self.version = 0
+
+    def appendColumn(self, values):
+        """
+            Append a column to the store
+
+            Attributes:
+                values (list): cells of the new column
+        """
+        self.version += 1
+        column = list(values)
+        count = self.rowCount()
+
+        if len(column) < count:
+            column.extend([""] * (count - len(column)))
+
+        self.columns.append(column)
+
+    def appendRow(self, values):
+        """
+            Append a row to the store
+
+            Attributes:
+                values (list): cells of the new row
+        """
+        self.version += 1
+        values = list(values)
+        self.widen(len(values))
+        count = self.rowCount()
+
+        for j in xrange(len(self.columns)):
+            column = self.padColumn(j, count)
+            column.append(values[j] if j < len(values) else "")
+
+    def appendColumns(self, new_columns):
+        """
+            Append a block of rows given as columns, e.g., rows parsed
+            elsewhere and already transposed
+
+            Attributes:
+                new_columns (list): sequences of cells, all the same length
+        """
+        self.version += 1
+        self.normalize()
+        count = len(new_columns[0]) if new_columns else 0
+
+        if count == 0:
+            return
+
+        self.widen(len(new_columns))
+
+        for j, column in enumerate(self.columns):
+            if j < len(new_columns):
+                column.extend(new_columns[j])
+            else:
+                column.extend([""] * count)
+
+    def appendRows(self, rows):
+        """
+            Append many rows to the store at once. Each cell is appended
+            straight to its column as the rows are read, so rows from a
+            generator are never all held at once.
+
+            Attributes:
+                rows (iterable): rows (lists) to add
+        """
+        self.version += 1
+        self.normalize()
+
+        count = self.rowCount()
+        width = len(self.columns)
+        appends = [column.append for column in self.columns]
+
+        for row in rows:
+            if len(row) == width:
+                for append, cell in izip(appends, row):
+                    append(cell)
+            else:
+                # Rows wider than the store add blank columns
+                if len(row) > width:
+                    for j in xrange(width, len(row)):
+                        self.columns.append([""] * count)
+
+                    width = len(self.columns)
+                    appends = [column.append for column in self.columns]
+
+                for append, cell in izip_longest(appends, row, fillvalue=""):
+                    append(cell)
+
+            count += 1
+
+    def column(self, column):
+        """
+            Get a view over the column at the specified index
+
+            Attributes:
+                column (int): index of the column
+
+            Returns:
+                ColumnView: view reading and writing the column's cells
+        """
+        count = len(self.columns)
+
+        if column < 0:
+            column += count
+
+        if column < 0 or column >= count:
+            raise IndexError("column index out of range")
+
+        return ColumnView(self, column)
+
+    def columnsView(self):
+        """
+            Get a view over every column in the store
+        """
+        return ColumnsView(self)
+
+    def columnCount(self):
+        """
+            Returns number of columns in the store
+        """
+        return len(self.columns)
+
+    def deleteColumn(self, column):
+        """
+            Delete a column from the store
+
+            Attributes:
+                column (int): index of the column to remove
+        """
+        self.version += 1
+        del self.columns[column]
+
+    def deleteRow(self, row):
+        """
+            Delete a row from every column
+
+            Attributes:
+                row (int): index of the row to remove
+        """
+        self.version += 1
+        row = self.rowIndex(row)
+
+        # Columns too short to hold the row have nothing to remove
+        for column in self.columns:
+            if row < len(column):
+                del column[row]
+
+    def insertRow(self, row, values):
+        """
+            Insert a row before the specified index
+
+            Attributes:
+                row (int): index to insert the row at
+                values (list): cells of the new row
+        """
+        self.version += 1
+        values = list(values)
+        self.widen(len(values))
+        count = self.rowCount()
+
+        # Clamp row as list.insert() would, so short columns pad up to it
+        if row < 0:
+            row = max(row + count, 0)
+
+        row = min(row, count)
+
+        for j in xrange(len(self.columns)):
+            column = self.padColumn(j, row)
+            column.insert(row, values[j] if j < len(values) else "")
+
+    def normalize(self):
+        """
+            Make sure all columns are the same length
+        """
+        count = self.rowCount()
+
+        for j in xrange(len(self.columns)):
+            self.padColumn(j, count)
+
+    def padColumn(self, column, length):
+        """
+            Pad a column with "" to at least the specified length
+
+            Attributes:
+                column (int): index of the column
+                length (int): minimum number of cells
+
+            Returns:
+                list: the store's column list
+        """
+        cells = self.columns[column]
+
+        if len(cells) < length:
+            self.version += 1
+            cells.extend([""] * (length - len(cells)))
+
+        return cells
+
+    def row(self, row):
+        """
+            Get a view over the row at the specified index
+
+            Attributes:
+                row (int): index of the row
+
+            Returns:
+                RowView: view reading and writing the row's cells
+        """
+        return RowView(self, self.rowIndex(row))
+
+    def rowCount(self):
+        """
+            Returns number of rows in the store
+        """
+        if not self.columns:
+            return 0
+
+        return len(max(self.columns, key=len))
+
+    def rowIndex(self, row):
+        """
+            Get the positive index of a row
+
+            Attributes:
+                row (int): index of the row, negative indices allowed
+
+            Raises:
+                IndexError: if row is out of range
+        """
+        count = self.rowCount()
+
+        if row < 0:
+            row += count
+
+        if row < 0 or row >= count:
+            raise IndexError("row index out of range")
+
+        return row
+
+    def rows(self):
+        """
+            Get a view over every row in the store
+        """
+        return RowsView(self)
+
+    def setColumns(self, columns):
+        """
+            Replace the store's data with a list of columns
+
+            Attributes:
+                columns (list): list of column lists
+        """
+        self.version += 1
+        self.columns = [column if isinstance(column, list) else list(column)
+                        for column in columns]
+        self.normalize()
+
+    def setRow(self, row, values):
+        """
+            Replace the cells of the row at the specified index
+
+            Attributes:
+                row (int): index of the row
+                values (list): new cells for the row
+        """
+        self.version += 1
+        row = self.rowIndex(row)
+        values = list(values)
+        self.widen(len(values))
+
+        for j in xrange(len(self.columns)):
+            column = self.padColumn(j, row + 1)
+            column[row] = values[j] if j < len(values) else ""
+
+    def setRows(self, rows):
+        """
+            Replace the store's data with a list of rows
+
+            Attributes:
+                rows (iterable): rows (lists) to store
+        """
+        # rows may be views of this store, so read them all before replacing
+        store = ColumnStore()
+        store.appendRows(rows)
+
+        self.version += 1
+        self.columns = store.columns
+
+    def widen(self, width):
+        """
+            Add blank columns until the store has at least width columns
+
+            Attributes:
+                width (int): minimum number of columns
+        """
+        self.version += 1
+        count = self.rowCount()
+
+        for j in xrange(len(self.columns), width):
+            self.columns.append([""] * count)
+
+
+class RowView(object):
+
+    """
+        RowView is a list-like view of one row in a ColumnStore. Reading and
+        writing cells goes straight to the store's columns.
+    """
+
+    __slots__ = ('store', 'position')
+
+    def __init__(self, store, position):
+        """
+            Initializes an instance of this class
+
+            Attributes:
+                store (ColumnStore): store holding the row
+                position (int): index of the row in the store
+        """
+        self.store = store
+        self.position = position
+
+    def __add__(self, other):
+        """
+            Returns a new list of this row's cells followed by other's
+        """
+        return list(self) + list(other)
+
+    def __contains__(self, value):
+        """
+            Returns True if value is a cell of this row
+        """
+        return value in list(self)
+
+    def __eq__(self, other):
+        """
+            Compares the cells of this row to other
+        """
+        if isinstance(other, (list, tuple, RowView)):
+            return list(self) == list(other)
+        return False
+
+    def __getitem__(self, key):
+        """
+            Get cell(s) at specified index or slice. Cells past the end of a
+            short column are read as "".
+        """
+        position = self.position
+
+        if isinstance(key, slice):
+            return [column[position] if position < len(column) else ""
+                    for column in self.store.columns[key]]
+
+        column = self.store.columns[key]
+        return column[position] if position < len(column) else ""
+
+    def __iadd__(self, values):
+        """
+            Extend this row in place
+        """
+        self.extend(values)
+        return self
+
+    def __iter__(self):
+        """
+            Enable iteration over the cells of this row
+        """
+        position = self.position
+        return (column[position] if position < len(column) else ""
+                for column in self.store.columns)
+
+    def __len__(self):
+        """
+            Returns number of cells in this row
+        """
+        return len(self.store.columns)
+
+    def __ne__(self, other):
+        """
+            Compares the cells of this row to other
+        """
+        return not self.__eq__(other)
+
+    def __radd__(self, other):
+        """
+            Returns a new list of other's cells followed by this row's
+        """
+        return list(other) + list(self)
+
+    def __repr__(self):
+        """
+            Formats the string representation of this row
+        """
+        return repr(list(self))
+
+    def __setitem__(self, key, value):
+        """
+            Set cell(s) at specified index or slice
+        """
+        store = self.store
+        store.version += 1
+        position = self.position
+
+        # Pad only the columns written to
+        if isinstance(key, slice):
+            indices = xrange(*key.indices(len(store.columns)))
+            for j, item in zip(indices, value):
+                store.padColumn(j, position + 1)[position] = item
+        else:
+            store.padColumn(key, position + 1)[position] = value
+
+    def append(self, value):
+        """
+            Append a cell to the end of this row
+
+            Attributes:
+                value (str): data to add
+        """
+        self.store.widen(len(self) + 1)
+        self.store.columns[-1][self.position] = value
+
+    def extend(self, values):
+        """
+            Extend this row with cells
+
+            Attributes:
+                values (list): data to add
+        """
+        for value in values:
+            self.append(value)
+
+    def index(self, value):
+        """
+            Returns index of the first cell equal to value
+        """
+        return list(self).index(value)
+
+
+class RowsView(object):
+
+    """
+        RowsView is a list-like view of all rows in a ColumnStore. Items are
+        RowView objects; adding or removing rows updates every column.
+    """
+
+    __slots__ = ('store',)
+
+    def __init__(self, store):
+        """
+            Initializes an instance of this class
+
+            Attributes:
+                store (ColumnStore): store holding the rows
+        """
+        self.store = store
+
+    def __delitem__(self, key):
+        """
+            Remove row(s) at specified index or slice
+        """
+        if isinstance(key, slice):
+            self.store.version += 1
+            self.store.normalize()
+            for column in self.store.columns:
+                del column[key]
+        else:
+            self.store.deleteRow(key)
+
+    def __getitem__(self, key):
+        """
+            Get row view(s) at specified index or slice
+        """
+        store = self.store
+
+        if isinstance(key, slice):
+            return [RowView(store, i)
+                    for i in xrange(*key.indices(store.rowCount()))]
+        return store.row(key)
+
+    def __iter__(self):
+        """
+            Enable iteration over the rows of the store
+        """
+        store = self.store
+        return (RowView(store, i) for i in xrange(store.rowCount()))
+
+    def __len__(self):
+        """
+            Returns number of rows in the store
+        """
+        return self.store.rowCount()
+
+    def __repr__(self):
+        """
+            Formats the string representation of the rows
+        """
+        return repr([list(row) for row in self])
+
+    def __setitem__(self, key, values):
+        """
+            Replace row at specified index
+        """
+        self.store.setRow(key, values)
+
+    def append(self, values):
+        """
+            Append a row
+
+            Attributes:
+                values (list): cells of the new row
+        """
+        self.store.appendRow(values)
+
+    def extend(self, rows):
+        """
+            Append many rows
+
+            Attributes:
+                rows (iterable): rows to add
+        """
+        self.store.appendRows(rows)
+
+    def index(self, values):
+        """
+            Returns index of the first row equal to values
+        """
+        values = list(values)
+
+        for i, row in enumerate(self):
+            if row == values:
+                return i
+
+        raise ValueError("row is not in spreadsheet")
+
+    def insert(self, index, values):
+        """
+            Insert a row before the specified index
+        """
+        self.store.insertRow(index, values)
+
+
+class ColumnsView(object):
+
+    """
+        ColumnsView is a list-like view of all columns in a ColumnStore. Items
+        are ColumnView objects, so edits to a column change the store's
+        version.
+    """
+
+    __slots__ = ('store',)
+
+    def __init__(self, store):
+        """
+            Initializes an instance of this class
+
+            Attributes:
+                store (ColumnStore): store holding the columns
+        """
+        self.store = store
+
+    def __delitem__(self, key):
+        """
+            Remove column(s) at specified index or slice
+        """
+        self.store.deleteColumn(key)
+
+    def __getitem__(self, key):
+        """
+            Get column(s) at specified index or slice
+        """
+        store = self.store
+
+        if isinstance(key, slice):
+            return [ColumnView(store, j)
+                    for j in xrange(*key.indices(len(self)))]
+        return store.column(key)
+
+    def __iter__(self):
+        """
+            Enable iteration over the columns of the store
+        """
+        store = self.store
+        return (ColumnView(store, j) for j in xrange(len(self)))
+
+    def __len__(self):
+        """
+            Returns number of columns in the store
+        """
+        return self.store.columnCount()
+
+    def __repr__(self):
+        """
+            Formats the string representation of the columns
+        """
+        return repr(list(self))
+
+    def __setitem__(self, key, values):
+        """
+            Replace column at specified index
+        """
+        self.store.version += 1
+        self.store.columns[key] = list(values)
+
+    def append(self, values):
+        """
+            Append a column
+
+            Attributes:
+                values (list): cells of the new column
+        """
+        self.store.version += 1
+        self.store.columns.append(list(values))
+
+    def extend(self, columns):
+        """
+            Append many columns
+
+            Attributes:
+                columns (iterable): columns to add
+        """
+        for values in columns:
+            self.append(values)
+
+
+class ColumnView(object):
+
+    """
+        ColumnView is a list-like view of one column in a ColumnStore. A
+        short column is read as if padded with "" to the row count, without
+        changing it. Every write changes the store's version, so numeric
+        conversions and indexes of the column are rebuilt on their next use.
+    """
+
+    __slots__ = ('store', 'position')
+
+    def __init__(self, store, position):
+        """
+            Initializes an instance of this class
+
+            Attributes:
+                store (ColumnStore): store holding the column
+                position (int): index of the column in the store
+        """
+        self.store = store
+        self.position = position
+
+    def __add__(self, other):
+        """
+            Returns a new list of this column's cells followed by other's
+        """
+        return list(self) + list(other)
+
+    def __contains__(self, value):
+        """
+            Returns True if value is a cell of this column
+        """
+        return value in list(self)
+
+    def __delitem__(self, key):
+        """
+            Remove cell(s) at specified index or slice
+        """
+        cells = self.written()
+        del cells[key]
+
+    def __eq__(self, other):
+        """
+            Compares the cells of this column to other
+        """
+        if isinstance(other, (list, tuple, ColumnView)):
+            return list(self) == list(other)
+        return False
+
+    def __getitem__(self, key):
+        """
+            Get cell(s) at specified index or slice. Cells past the end of a
+            short column are read as "".
+        """
+        cells = self.store.columns[self.position]
+        count = self.store.rowCount()
+
+        if len(cells) == count:
+            return cells[key]
+
+        if isinstance(key, slice):
+            return [cells[i] if i < len(cells) else ""
+                    for i in xrange(*key.indices(count))]
+
+        if key < 0:
+            key += count
+
+        if key < 0 or key >= count:
+            raise IndexError("column index out of range")
+
+        return cells[key] if key < len(cells) else ""
+
+    def __iadd__(self, values):
+        """
+            Extend this column in place
+        """
+        self.extend(values)
+        return self
+
+    def __iter__(self):
+        """
+            Enable iteration over the cells of this column
+        """
+        cells = self.store.columns[self.position]
+        blank = self.store.rowCount() - len(cells)
+
+        if blank > 0:
+            return chain(cells, repeat("", blank))
+        return iter(cells)
+
+    def __len__(self):
+        """
+            Returns number of cells in this column
+        """
+        return self.store.rowCount()
+
+    def __ne__(self, other):
+        """
+            Compares the cells of this column to other
+        """
+        return not self.__eq__(other)
+
+    def __radd__(self, other):
+        """
+            Returns a new list of other's cells followed by this column's
+        """
+        return list(other) + list(self)
+
+    def __repr__(self):
+        """
+            Formats the string representation of this column
+        """
+        return repr(list(self))
+
+    def __setitem__(self, key, value):
+        """
+            Set cell(s) at specified index or slice
+        """
+        cells = self.written()
+        cells[key] = value
+
+    def append(self, value):
+        """
+            Append a cell to the end of this column
+
+            Attributes:
+                value (str): data to add
+        """
+        self.written().append(value)
+
+    def count(self, value):
+        """
+            Returns number of cells equal to value
+        """
+        return list(self).count(value)
+
+    def extend(self, values):
+        """
+            Extend this column with cells
+
+            Attributes:
+                values (list): data to add
+        """
+        self.written().extend(values)
+
+    def index(self, value):
+        """
+            Returns index of the first cell equal to value
+        """
+        return list(self).index(value)
+
+    def insert(self, index, value):
+        """
+            Insert a cell before the specified index
+        """
+        self.written().insert(index, value)
+
+    def pop(self, index=-1):
+        """
+            Remove and return the cell at the specified index
+        """
+        return self.written().pop(index)
+
+    def written(self):
+        """
+            Get the store's list for this column, padded to the row count,
+            and mark the store as changed. Used before every write.
+
+            Returns:
+                list: the store's column list
+        """
+        store = self.store
+        store.version += 1
+        return store.padColumn(self.position, store.rowCount())
+
+
+class TransposedView(object):
+
+    """
+        TransposedView is a list-like view of a list of lists with its rows
+        and columns swapped: view[i][j] is lines[j][i]. Nothing is copied;
+        missing cells of short lines are read as "" and padded only when
+        written. Lines appended to or set on the view are written across
+        the lines under it.
+    """
+
+    __slots__ = ('lines',)
+
+    def __init__(self, lines):
+        """
+            Initializes an instance of this class
+
+            Attributes:
+                lines (list): list of lists to view
+        """
+        self.lines = lines
+
+    def __getitem__(self, key):
+        """
+            Get transposed line(s) at specified index or slice
+        """
+        if isinstance(key, slice):
+            return [TransposedLine(self.lines, i)
+                    for i in xrange(*key.indices(len(self)))]
+
+        count = len(self)
+
+        if key < 0:
+            key += count
+
+        if key < 0 or key >= count:
+            raise IndexError("index out of range")
+
+        return TransposedLine(self.lines, key)
+
+    def __iter__(self):
+        """
+            Enable iteration over the transposed lines
+        """
+        lines = self.lines
+        return (TransposedLine(lines, i) for i in xrange(len(self)))
+
+    def __len__(self):
+        """
+            Returns length of the longest line being viewed
+        """
+        if not self.lines:
+            return 0
+
+        return len(max(self.lines, key=len))
+
+    def __repr__(self):
+        """
+            Formats the string representation of the view
+        """
+        return repr([list(line) for line in self])
+
+    def __setitem__(self, key, values):
+        """
+            Replace the transposed line at specified index: item j of values
+            is written to lines[j][key]
+        """
+        count = len(self)
+
+        if key < 0:
+            key += count
+
+        if key < 0 or key >= count:
+            raise IndexError("index out of range")
+
+        lines = self.lines
+        values = list(values)
+
+        for j, line in enumerate(lines):
+            value = values[j] if j < len(values) else ""
+
+            if key < len(line):
+                line[key] = value
+            elif value != "":
+                line.extend([""] * (key - len(line)))
+                line.append(value)
+
+        # Values past the last line start new lines
+        for value in values[len(lines):]:
+            lines.append([""] * key + [value])
+
+    def append(self, values):
+        """
+            Append a transposed line: item j of values is added to lines[j]
+            at the next position, padding short lines and starting new ones
+            as needed
+
+            Attributes:
+                values (list): cells of the new line
+        """
+        lines = self.lines
+        position = len(self)
+
+        for j, value in enumerate(values):
+            if j == len(lines):
+                lines.append([])
+
+            line = lines[j]
+
+            if len(line) < position:
+                line.extend([""] * (position - len(line)))
+
+            line.append(value)
+
+    def extend(self, lines):
+        """
+            Append transposed lines
+
+            Attributes:
+                lines (iterable): lists of cells of the new lines
+        """
+        for values in lines:
+            self.append(values)
+
+    def transpose(self):
+        """
+            Returns the list of lists under this view
+        """
+        return self.lines
+
+
+class TransposedLine(object):
+
+    """
+        TransposedLine is one line of a TransposedView: item j is
+        lines[j][position].
+    """
+
+    __slots__ = ('lines', 'position')
+
+    def __init__(self, lines, position):
+        """
+            Initializes an instance of this class
+
+            Attributes:
+                lines (list): list of lists being viewed
+                position (int): index of this line in the view
+        """
+        self.lines = lines
+        self.position = position
+
+    def __eq__(self, other):
+        """
+            Compares the cells of this line to other
+        """
+        if isinstance(other, (list, tuple, TransposedLine)):
+            return list(self) == list(other)
+        return False
+
+    def __getitem__(self, key):
+        """
+            Get cell(s) at specified index or slice
+        """
+        position = self.position
+
+        if isinstance(key, slice):
+            return [line[position] if position < len(line) else ""
+                    for line in self.lines[key]]
+
+        line = self.lines[key]
+        return line[position] if position < len(line) else ""
+
+    def __iter__(self):
+        """
+            Enable iteration over the cells of this line
+        """
+        position = self.position
+        return (line[position] if position < len(line) else ""
+                for line in self.lines)
+
+    def __len__(self):
+        """
+            Returns number of cells in this line
+        """
+        return len(self.lines)
+
+    def __ne__(self, other):
+        """
+            Compares the cells of this line to other
+        """
+        return not self.__eq__(other)
+
+    def __repr__(self):
+        """
+            Formats the string representation of this line
+        """
+        return repr(list(self))
+
+    def __setitem__(self, key, value):
+        """
+            Set cell at specified index, padding the line it falls in
+        """
+        line = self.lines[key]
+        position = self.position
+
+        if position >= len(line):
+            line.extend([""] * (position + 1 - len(line)))
+
+        line[position] = value
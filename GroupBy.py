@@ -0,0 +1,351 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Name:     GroupBy.py
+# Version:  1.0.0
+# Author:   Glenn Abastillas
+# Date:     October 18, 2026
+#
+# Purpose: Allows the user to:
+#           1.) Group spreadsheet rows by the values of one or more columns.
+#           2.) Count, sum, average, and find the minimum, maximum and number
+#               of distinct values of columns within each group.
+#
+# This class is used in the following classes:
+#       - Spreadsheet.py
+#       - MappedSpreadsheet.py
+# - - - - - - - - - - - - -
+"""
+    GroupBy aggregates spreadsheet rows with a hash table of groups. Rows are
+    read once, so rows streamed from a file are never held in memory; only
+    one running total per group and aggregate is kept.
+"""
+
+__author__ = "Glenn Abastillas"
+__copyright__ = "Copyright (c) October 18, 2026"
+__credits__ = "Glenn Abastillas"
+
+__license__ = "Free"
+__version__ = "1.0.0"
+__maintainer__ = "Glenn Abastillas"
+
+from operator import itemgetter
+
+
+class Count(object):
+
+    """
+        Count counts the non-blank cells of a group
+    """
+
+    __slots__ = ('total',)
+
+    def __init__(self):
+        self.total = 0
+
+    def add(self, cell):
+        if cell != "":
+            self.total += 1
+
+    def value(self):
+        return self.total
+
+
+class Rows(object):
+
+    """
+        Rows counts the rows of a group
+    """
+
+    __slots__ = ('total',)
+
+    def __init__(self):
+        self.total = 0
+
+    def add(self, cell):
+        self.total += 1
+
+    def value(self):
+        return self.total
+
+
+class Sum(object):
+
+    """
+        Sum adds the non-blank cells of a group as numbers
+    """
+
+    __slots__ = ('total',)
+
+    def __init__(self):
+        self.total = 0.0
+
+    def add(self, cell):
+        if cell != "":
+            self.total += float(cell)
+
+    def value(self):
+        return self.total
+
+
+class Mean(object):
+
+    """
+        Mean averages the non-blank cells of a group as numbers
+    """
+
+    __slots__ = ('total', 'count')
+
+    def __init__(self):
+        self.total = 0.0
+        self.count = 0
+
+    def add(self, cell):
+        if cell != "":
+            self.total += float(cell)
+            self.count += 1
+
+    def value(self):
+        if self.count == 0:
+            return None
+        return self.total / self.count
+
+
+class Min(object):
+
+    """
+        Min finds the smallest non-blank cell of a group as a number
+    """
+
+    __slots__ = ('least',)
+
+    def __init__(self):
+        self.least = None
+
+    def add(self, cell):
+        if cell != "":
+            cell = float(cell)
+
+            if self.least is None or cell < self.least:
+                self.least = cell
+
+    def value(self):
+        return self.least
+
+
+class Max(object):
+
+    """
+        Max finds the largest non-blank cell of a group as a number
+    """
+
+    __slots__ = ('most',)
+
+    def __init__(self):
+        self.most = None
+
+    def add(self, cell):
+        if cell != "":
+            cell = float(cell)
+
+            if self.most is None or cell > self.most:
+                self.most = cell
+
+    def value(self):
+        return self.most
+
+
+class Distinct(object):
+
+    """
+        Distinct counts the different non-blank cells of a group
+    """
+
+    __slots__ = ('values',)
+
+    def __init__(self):
+        self.values = set()
+
+    def add(self, cell):
+        if cell != "":
+            self.values.add(cell)
+
+    def value(self):
+        return len(self.values)
+
+
+class GroupBy(object):
+
+    """
+        GroupBy groups rows by the values of its key columns and aggregates
+        other columns within each group.
+
+        Aggregates are 'count', 'sum', 'mean', 'min', 'max' and 'distinct'.
+        Blank cells are left out of every aggregate. 'count' on its own counts
+        the rows of each group.
+
+        User Accesible Methods:
+
+            agg(*aggregations (str, tuple))
+                --> Gets a new Spreadsheet with one row per group, e.g.,
+                    agg("count", ("score", "mean"), ("dice", "distinct")).
+                    Aggregate columns are named column_function, e.g.,
+                    "score_mean", or "count" for the row count.
+    """
+
+    FUNCTIONS = {"count": Count,
+                 "sum": Sum,
+                 "mean": Mean,
+                 "min": Min,
+                 "max": Max,
+                 "distinct": Distinct}
+
+    def __init__(self, headers, columns, rows):
+        """
+            Initializes an instance of this class
+
+            Attributes:
+                headers (list): column names of the rows
+                columns (list): names or indices of the columns to group by
+                rows (function): takes a list of column indices and returns
+                                 an iterable of data rows holding only those
+                                 columns' cells, in that order
+
+            Raises:
+                ValueError: if a column name is not in headers
+        """
+        if not isinstance(columns, list):
+            columns = [columns]
+
+        self.headers = headers
+        self.columns = [self.resolve(column) for column in columns]
+        self.rows = rows
+
+    def agg(self, *aggregations):
+        """
+            Aggregate each group in one pass over the rows
+
+            Attributes:
+                aggregations (str, tuple): 'count' for the number of rows,
+                                           or (column, function) pairs
+
+            Returns:
+                Spreadsheet: one row per group, in order of first appearance
+
+            Raises:
+                ValueError: if a function is unknown, a column name is not in
+                            headers, or a cell to sum, average, etc. is not a
+                            number
+        """
+        from Spreadsheet import Spreadsheet
+
+        if not aggregations:
+            aggregations = ("count",)
+
+        keyCount = len(self.columns)
+        names = [self.headers[j] for j in self.columns]
+        factories = list()
+
+        # Read the key columns, then one column per aggregate
+        indices = list(self.columns)
+
+        for aggregation in aggregations:
+
+            if not isinstance(aggregation, tuple):
+                aggregation = (None, aggregation)
+
+            column, function = aggregation
+
+            if function not in self.FUNCTIONS:
+                raise ValueError("'{0}' is not an aggregate. Use one of: "
+                                 "{1}".format(function,
+                                              ", ".join(sorted(self.FUNCTIONS))))
+
+            if column is None:
+                if function != "count":
+                    raise ValueError("'{0}' needs a column".format(function))
+
+                # Count rows; any cell will do
+                names.append(function)
+                factories.append(Rows)
+                indices.append(self.columns[0])
+                continue
+
+            column = self.resolve(column)
+            names.append("{0}_{1}".format(self.headers[column], function))
+            factories.append(self.FUNCTIONS[function])
+            indices.append(column)
+
+        key = itemgetter(*range(keyCount))
+        work = [(n, keyCount + n) for n in xrange(len(factories))]
+
+        groups = dict()
+        order = list()
+
+        for row in self.rows(indices):
+            group = key(row)
+            totals = groups.get(group)
+
+            if totals is None:
+                totals = groups[group] = [factory() for factory in factories]
+                order.append(group)
+
+            for n, position in work:
+                totals[n].add(row[position])
+
+        columns = [[name] for name in names]
+
+        for group in order:
+            cells = list(group) if keyCount > 1 else [group]
+            cells += [self.format(total.value()) for total in groups[group]]
+
+            for column, cell in zip(columns, cells):
+                column.append(cell)
+
+        result = Spreadsheet()
+        result.setData(columns)
+        result.toRows()
+        return result
+
+    def format(self, value):
+        """
+            Get an aggregate as a cell. Whole numbers are written without a
+            decimal point and missing values are blank.
+
+            Attributes:
+                value (int, float): aggregate of a group
+
+            Returns:
+                str: cell text
+        """
+        if value is None:
+            return ""
+
+        if isinstance(value, float):
+            if value.is_integer() and abs(value) < 1e15:
+                return str(int(value))
+            return repr(value)
+
+        return str(value)
+
+    def resolve(self, column):
+        """
+            Get the index of a column
+
+            Attributes:
+                column (str, int): index or name of column
+
+            Returns:
+                int: index of column
+
+            Raises:
+                ValueError: if a column name is not in headers
+        """
+        if isinstance(column, int):
+            return column
+
+        if column not in self.headers:
+            raise ValueError("'{0}' is not a column in this "
+                             "spreadsheet".format(column))
+
+        return self.headers.index(column)
@@ -0,0 +1,571 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Name:     MappedSpreadsheet.py
+# Version:  1.0.0
+# Author:   Glenn Abastillas
+# Date:     October 18, 2026
+#
+# Purpose: Allows the user to:
+#           1.) Open a large spreadsheet file without loading it into memory.
+#           2.) Access rows and cells at random, parsing only the rows used.
+#
+# This class inherits from the following classes:
+#       - Spreadsheet.py
+# - - - - - - - - - - - - -
+"""
+    MappedSpreadsheet is a read-only Spreadsheet over a memory-mapped file.
+    Opening the file makes one pass to record where each line starts; rows
+    are split only when they are accessed.
+"""
+
+__author__ = "Glenn Abastillas"
+__copyright__ = "Copyright (c) October 18, 2026"
+__credits__ = "Glenn Abastillas"
+
+__license__ = "Free"
+__version__ = "1.0.0"
+__maintainer__ = "Glenn Abastillas"
+
+from array import array
+import mmap
+
+from ColumnIndex import HashIndex, SortedIndex
+from NumericColumn import NumericColumn
+from Spreadsheet import Spreadsheet
+
+
+class MappedSpreadsheet(Spreadsheet):
+
+    """
+        MappedSpreadsheet memory-maps a spreadsheet file and keeps an array of
+        line-start byte offsets. Methods that read data (row(), cell(),
+        column(), getHeaders(), etc.) parse lines on demand. Methods that
+        change data raise a TypeError.
+
+        User Accesible Methods:
+
+            close()
+                --> Unmaps and closes the file. A MappedSpreadsheet can
+                    also be used in a with statement, which closes it.
+
+            line(row (int))
+                --> Gets the raw text of a row without splitting it.
+
+            Read-only methods inherited from Spreadsheet: row(), cell(),
+            column(), getColumnCount(), getColumnIndex(), getColumnName(),
+            getColumnType(), getHeaders(), getRowCount(), getRowIndex(),
+            inferTypes(), iterLines(), numeric(), prepareForSave(), save()
+            and toString().
+
+            Indexes from createIndex(), findRows(), findRange() and
+            findPrefix() are built with one pass over the file. Sorted
+            indexes use the column's type as their collation unless one is
+            given.
+
+            load() does not support where, cache, workers or quoted; they
+            raise a TypeError.
+    """
+
+    def __init__(self, filePath=None, savePath=None, delimiter="\t"):
+        """
+            Initializes an instance of this class
+
+            Attributes:
+                filePath (str): path of the spreadsheet file to be mapped
+                savePath (str): write to this location
+                delimiter (str): spreadsheet delimiter
+
+            Raises:
+                ValueError: if filePath is not specified
+        """
+        if filePath is None:
+            raise ValueError("Please enter a file path for this class'" +
+                             " filePath parameter")
+
+        # memory-mapped file and its file object
+        self.mapped = None
+        self.fileIn = None
+
+        # byte offset of the start of each line, plus the end of the file
+        self.offsets = array('L')
+
+        # delimiter used to split rows
+        self.delimiter = delimiter
+
+        super(MappedSpreadsheet, self).__init__(filePath=filePath,
+                                                savePath=savePath,
+                                                delimiter=delimiter)
+
+    def __enter__(self):
+        """
+            Returns this spreadsheet for use in a with statement
+        """
+        return self
+
+    def __exit__(self, *exception):
+        """
+            Closes the file at the end of a with statement
+        """
+        self.close()
+        return False
+
+    @property
+    def spreadsheet(self):
+        """
+            Returns the rows of the mapped file as a read-only sequence
+        """
+        return MappedRows(self)
+
+    @spreadsheet.setter
+    def spreadsheet(self, data):
+        """
+            MappedSpreadsheet data cannot be replaced
+        """
+        self.readOnly()
+
+    def readOnly(self, *args, **kwargs):
+        """
+            Raises:
+                TypeError: always, MappedSpreadsheet cannot be changed
+        """
+        raise TypeError("MappedSpreadsheet is read-only. Load the file " +
+                        "into a Spreadsheet to edit it.")
+
+    __setitem__ = readOnly
+    addToColumn = readOnly
+    addToRow = readOnly
+    fill = readOnly
+    newColumn = readOnly
+    removeColumn = readOnly
+    removeRow = readOnly
+    rename = readOnly
+    setData = readOnly
+    sort = readOnly
+    toColumns = readOnly
+    transpose = readOnly
+
+    def cell(self, row, column, data=None):
+        """
+            Get value at specified cell
+
+            Attributes:
+                row (int): index of cell row
+                column (int, str): index or name of cell column
+                data (str): not supported, raises a TypeError
+        """
+        if data is not None:
+            self.readOnly()
+
+        return self.row(row)[self.getColumnIndex(column)]
+
+    def unsupported(self, name):
+        """
+            Raises:
+                TypeError: always, name is not supported on a mapped file
+        """
+        raise TypeError("{0} is not supported on MappedSpreadsheet. Load "
+                        "the file into a Spreadsheet to use it.".format(name))
+
+    def close(self):
+        """
+            Unmap and close the file
+        """
+        if self.mapped is not None:
+            self.mapped.close()
+            self.mapped = None
+
+        if self.fileIn is not None:
+            self.fileIn.close()
+            self.fileIn = None
+
+    def column(self, column=0, data=None, number=False, header=False):
+        """
+            Get column at specified index. Every line of the file is split.
+
+            Attributes:
+                column (int, str): index or name of desired column
+                data (list): not supported, raises a TypeError
+                number (bool): convert list elements to numbers if True
+                header (bool): include header in list returned if True
+
+            Returns:
+                list: column elements
+        """
+        if data is not None or isinstance(column, list):
+            self.readOnly()
+
+        index = self.getColumnIndex(column)
+        values = list()
+        append = values.append
+
+        for row in self.spreadsheet:
+            append(row[index] if index < len(row) else "")
+
+        column_head = values[:1]
+        column_body = values[1:]
+
+        if number is True:
+            column_body = [float(row) for row in column_body if row != '']
+
+        if header:
+            return column_head + column_body
+
+        return column_body
+
+    def getColumnCount(self):
+        """
+            Return number of columns in spreadsheet data
+        """
+        return len(self.getHeaders())
+
+    def getColumnName(self, column):
+        """
+            Get the name of specified column
+
+            Attributes:
+                column (int): index of column
+
+            Returns:
+                str: name of column
+        """
+        return self.getHeaders()[self.getColumnIndex(column)]
+
+    def getHeaders(self):
+        """
+            Return headers for columns in the spreadsheet
+        """
+        if len(self) == 0:
+            return list()
+
+        return self.row(0)
+
+    def getRowCount(self):
+        """
+            Returns number of rows in spreadsheet data
+        """
+        return len(self) - 1
+
+    def getVersion(self):
+        """
+            Get the version of this spreadsheet's data. The mapped file is
+            read-only, so the version never changes.
+        """
+        return 0
+
+    def getIndex(self, column, ordered=False, collation=None):
+        """
+            Get the index on a column, building it if the column has none.
+            The mapped file does not change, so indexes are never rebuilt
+            unless a different collation is asked for.
+
+            Attributes:
+                column (str, int): index or name of column
+                ordered (bool): get a sorted index if True, else a hash index
+                collation (str): 'number' or 'text' for a sorted index
+
+            Returns:
+                HashIndex or SortedIndex: index on the column
+        """
+        index = self.getColumnIndex(column)
+        cached = self.indexes.get((index, ordered))
+
+        if cached is not None:
+            columnIndex = cached[2]
+
+            if (not ordered or collation is None or
+                    columnIndex.collation == collation):
+                return columnIndex
+
+        if ordered and collation is None:
+            collation = self.getColumnType(index)
+
+        cells = self.column(index, header=True)
+
+        if ordered:
+            columnIndex = SortedIndex(cells, collation)
+        else:
+            columnIndex = HashIndex(cells)
+
+        self.indexes[(index, ordered)] = (None, None, columnIndex)
+        return columnIndex
+
+    def getRowIndex(self, data, column=None):
+        """
+            Get the index of a specified row
+
+            Attributes:
+                data (str): cell data whose row to get
+                column (str, int): if specified, find the first row whose
+                                   cell in this column equals data, using
+                                   the column's index
+
+            Returns:
+                int: index of row
+                None: if data does not match row[0]
+        """
+        if column is not None:
+            rows = self.findRows(column, data)
+            return rows[0] if rows else None
+
+        for i, row in enumerate(self.spreadsheet):
+            if data in row[0]:
+                return i
+
+        return None
+
+    def inferTypes(self):
+        """
+            Determine the type of every column. Numeric columns are converted
+            and cached for numeric().
+
+            Returns:
+                list: 'number' or 'text' for each column
+        """
+        return [self.getColumnType(i) for i in xrange(self.getColumnCount())]
+
+    def line(self, row):
+        """
+            Get the text of a row without its line ending
+
+            Attributes:
+                row (int): index of row
+
+            Returns:
+                str: text of the row
+        """
+        count = len(self.offsets) - 1
+
+        if row < 0:
+            row += count
+
+        if row < 0 or row >= count:
+            raise IndexError("row index out of range")
+
+        text = self.mapped[self.offsets[row]:self.offsets[row + 1]]
+
+        if text.endswith("\n"):
+            text = text[:-1]
+
+        if text.endswith("\r"):
+            text = text[:-1]
+
+        return text
+
+    def load(self, filePath=None, delimiter="\t", typed=False, where=None,
+             cache=False, workers=None, quoted=False):
+        """
+            Map the file and record the byte offset of each line
+
+            Attributes:
+                filePath (str): spreadsheet file to map
+                delimiter (str): delimiter of document at filePath
+                typed (bool): convert numeric columns on load if True
+                where, cache, workers, quoted: not supported on a mapped
+                                               file, see Spreadsheet.load()
+
+            Raises:
+                ValueError: if filePath is not specified
+                TypeError: if where, cache, workers or quoted is set
+        """
+        if filePath is None:
+            raise ValueError("Please enter a file path for this method's" +
+                             " filePath parameter")
+
+        for name, value in (("where", where), ("cache", cache),
+                            ("workers", workers), ("quoted", quoted)):
+            if value:
+                self.unsupported("load({0}=...)".format(name))
+
+        self.close()
+
+        self.fileIn = open(filePath, 'rb')
+        self.delimiter = delimiter
+        self.offsets = array('L', [0])
+
+        size = self.fileSize(self.fileIn)
+
+        if size > 0:
+            self.mapped = mmap.mmap(self.fileIn.fileno(), 0,
+                                    access=mmap.ACCESS_READ)
+
+            find = self.mapped.find
+            append = self.offsets.append
+            position = find("\n")
+
+            # Record the start of each line after a newline
+            while position != -1 and position + 1 < size:
+                append(position + 1)
+                position = find("\n", position + 1)
+
+            append(size)
+
+        self.filePath = filePath
+        self.loaded = True
+        self.initialized = True
+        self.headerIndex = None
+        self.numericColumns = dict()
+        self.indexes = dict()
+
+        if typed:
+            self.inferTypes()
+
+    def fileSize(self, fileIn):
+        """
+            Returns size in bytes of an open file
+        """
+        fileIn.seek(0, 2)
+        size = fileIn.tell()
+        fileIn.seek(0)
+        return size
+
+    def groupBy(self, columns):
+        """
+            Group the rows of the mapped file by the values of columns. The
+            file is streamed with groupFile().
+
+            Attributes:
+                columns (list): names or indices of columns to group by
+
+            Returns:
+                GroupBy: groups to aggregate with agg()
+        """
+        return self.groupFile(self.filePath, columns, self.delimiter)
+
+    def iterLines(self, spreadsheet=None, delimiter="\t", columns=None,
+                  quoted=False):
+        """
+            Yields rows formatted as lines of text for saving
+
+            Attributes:
+                spreadsheet (iterable): rows to format. The mapped file's
+                                        rows are used if None.
+                delimiter (str): delimiter to separate cells with
+                columns (list): names or indices of the columns to keep
+                quoted (bool): quote cells as needed, see
+                               Spreadsheet.iterLines()
+
+            Returns:
+                generator: one string per row, without a line ending
+        """
+        if spreadsheet is None:
+            spreadsheet = self.spreadsheet
+
+        return super(MappedSpreadsheet, self).iterLines(spreadsheet,
+                                                        delimiter, columns,
+                                                        quoted)
+
+    def numeric(self, column):
+        """
+            Get a column's values as numbers. The mapped file does not
+            change, so each column is converted at most once.
+
+            Attributes:
+                column (str, int): index or name of column
+
+            Returns:
+                NumericColumn: values of the column without the header
+
+            Raises:
+                ValueError: if a non-blank cell in the column is not a number
+        """
+        index = self.getColumnIndex(column)
+
+        if index not in self.numericColumns:
+            try:
+                numeric = NumericColumn(self.column(index))
+            except(ValueError):
+                numeric = None
+
+            self.numericColumns[index] = numeric
+
+        numeric = self.numericColumns[index]
+
+        if numeric is None:
+            raise ValueError("Column '{0}' is not "
+                             "numeric".format(self.getColumnName(index)))
+
+        return numeric
+
+    def records(self):
+        """
+            Yield each row of the mapped file, header first. Short rows are
+            padded with blank cells to the width of the header.
+
+            Returns:
+                generator: rows as lists
+        """
+        width = len(self.getHeaders())
+
+        for row in self.spreadsheet:
+            if len(row) < width:
+                row += [""] * (width - len(row))
+
+            yield row
+
+    def refresh(self):
+        """
+            Mapped rows are never padded, so there is nothing to refresh
+        """
+        pass
+
+    def row(self, row=0):
+        """
+            Get row at specified index
+
+            Attributes:
+                row (int): index for desired row
+
+            Returns:
+                list: row elements
+        """
+        if isinstance(row, list):
+            self.readOnly()
+
+        return self.line(int(row)).split(self.delimiter)
+
+    def toRows(self):
+        """
+            MappedSpreadsheet is always in rows
+        """
+        pass
+
+
+class MappedRows(object):
+
+    """
+        MappedRows is a read-only sequence of the rows in a MappedSpreadsheet.
+        Each row is split from the mapped file when it is accessed.
+    """
+
+    __slots__ = ('sheet',)
+
+    def __init__(self, sheet):
+        """
+            Initializes an instance of this class
+
+            Attributes:
+                sheet (MappedSpreadsheet): spreadsheet to read rows from
+        """
+        self.sheet = sheet
+
+    def __getitem__(self, key):
+        """
+            Get row(s) at specified index or slice
+        """
+        if isinstance(key, slice):
+            return [self.sheet.row(i) for i in xrange(*key.indices(len(self)))]
+        return self.sheet.row(key)
+
+    def __iter__(self):
+        """
+            Enable iteration over the rows of the file
+        """
+        row = self.sheet.row
+        return (row(i) for i in xrange(len(self)))
+
+    def __len__(self):
+        """
+            Returns number of rows in the file
+        """
+        return len(self.sheet.offsets) - 1
@@ -0,0 +1,165 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Name:     NumericColumn.py
+# Version:  1.0.0
+# Author:   Glenn Abastillas
+# Date:     October 18, 2026
+#
+# Purpose: Allows the user to:
+#           1.) Convert a spreadsheet column of numbers into a typed array.
+#           2.) Keep blank cells in place with a mask.
+#           3.) Sum, average, and find the minimum and maximum of a column.
+#
+# NumPy is used if it is installed. Otherwise values are kept in an
+# array.array('d') and aggregates are computed in Python.
+#
+# This class is used in the following classes:
+#       - Spreadsheet.py
+# - - - - - - - - - - - - -
+"""
+    NumericColumn holds the values of one spreadsheet column as floats. Blank
+    cells stay at their row position and are flagged in a mask, so the values
+    line up with the rows of the spreadsheet.
+"""
+
+__author__ = "Glenn Abastillas"
+__copyright__ = "Copyright (c) October 18, 2026"
+__credits__ = "Glenn Abastillas"
+
+__license__ = "Free"
+__version__ = "1.0.0"
+__maintainer__ = "Glenn Abastillas"
+
+from array import array
+
+try:
+    import numpy
+except(ImportError):
+    numpy = None
+
+NAN = float("nan")
+
+
+class NumericColumn(object):
+
+    """
+        NumericColumn converts a list of cell strings into floats once and
+        keeps them for repeated use.
+
+        Attributes:
+            values: numpy.ndarray (or array.array('d')) with one float per
+                    cell. Blank cells hold NaN.
+            mask: numpy.ndarray of bools (or array.array('b')), True (1) where
+                  the cell is blank.
+
+        User Accesible Methods:
+
+            count()
+                --> Gets the number of non-blank cells.
+
+            max(), mean(), min(), sum()
+                --> Gets the aggregate over the non-blank cells.
+
+            present()
+                --> Gets the non-blank values in row order.
+
+            tolist()
+                --> Gets the values as a list, with None for blank cells.
+    """
+
+    def __init__(self, cells):
+        """
+            Initializes an instance of this class
+
+            Attributes:
+                cells (list): cell strings of the column, without a header
+
+            Raises:
+                ValueError: if a non-blank cell is not a number
+        """
+        if numpy is not None:
+            self.mask = numpy.fromiter((cell == "" for cell in cells),
+                                       dtype=bool, count=len(cells))
+            self.values = numpy.array([NAN if cell == "" else cell
+                                       for cell in cells], dtype=float)
+        else:
+            self.mask = array('b', (cell == "" for cell in cells))
+            self.values = array('d', (NAN if cell == "" else float(cell)
+                                      for cell in cells))
+
+        # non-blank values, built on first use
+        self.nonBlank = None
+
+    def __getitem__(self, i):
+        """
+            Get value at specified index, None if the cell is blank
+        """
+        if self.mask[i]:
+            return None
+        return float(self.values[i])
+
+    def __len__(self):
+        """
+            Returns number of cells, including blank cells
+        """
+        return len(self.values)
+
+    def count(self):
+        """
+            Returns number of non-blank cells
+        """
+        return len(self.present())
+
+    def max(self):
+        """
+            Returns largest non-blank value, None if all cells are blank
+        """
+        if self.count() == 0:
+            return None
+        return float(max(self.present()))
+
+    def mean(self):
+        """
+            Returns average of non-blank values, None if all cells are blank
+        """
+        if self.count() == 0:
+            return None
+        return self.sum() / self.count()
+
+    def min(self):
+        """
+            Returns smallest non-blank value, None if all cells are blank
+        """
+        if self.count() == 0:
+            return None
+        return float(min(self.present()))
+
+    def present(self):
+        """
+            Returns non-blank values in row order
+        """
+        if self.nonBlank is None:
+            if numpy is not None:
+                self.nonBlank = self.values[~self.mask]
+            else:
+                self.nonBlank = array('d', (value for value, blank
+                                            in zip(self.values, self.mask)
+                                            if not blank))
+
+        return self.nonBlank
+
+    def sum(self):
+        """
+            Returns sum of non-blank values
+        """
+        if numpy is not None:
+            return float(self.present().sum())
+        return float(sum(self.present()))
+
+    def tolist(self):
+        """
+            Returns values as a list of floats, with None for blank cells
+        """
+        return [None if blank else float(value)
+                for value, blank in zip(self.values, self.mask)]
@@ -0,0 +1,207 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Name:     SortKey.py
+# Version:  1.0.0
+# Author:   Glenn Abastillas
+# Date:     October 18, 2026
+#
+# Purpose: Allows the user to:
+#           1.) Sort spreadsheet rows by several columns at once.
+#           2.) Choose the direction and numeric or text collation for each
+#               column.
+#
+# This class is used in the following classes:
+#       - Spreadsheet.py
+# - - - - - - - - - - - - -
+"""
+    SortKey turns a list of sort specifications into a key function for
+    sorted() and heapq.merge(). Numeric columns compare as numbers, so "9"
+    sorts before "10".
+"""
+
+__author__ = "Glenn Abastillas"
+__copyright__ = "Copyright (c) October 18, 2026"
+__credits__ = "Glenn Abastillas"
+
+__license__ = "Free"
+__version__ = "1.0.0"
+__maintainer__ = "Glenn Abastillas"
+
+
+class Descending(object):
+
+    """
+        Descending wraps a value so that it sorts in reverse order
+    """
+
+    __slots__ = ('value',)
+
+    def __init__(self, value):
+        """
+            Initializes an instance of this class
+
+            Attributes:
+                value (str): value to be sorted in reverse
+        """
+        self.value = value
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+    def __ge__(self, other):
+        return self.value <= other.value
+
+    def __gt__(self, other):
+        return self.value < other.value
+
+    def __le__(self, other):
+        return self.value >= other.value
+
+    def __lt__(self, other):
+        return self.value > other.value
+
+    def __ne__(self, other):
+        return self.value != other.value
+
+
+class SortKey(object):
+
+    """
+        SortKey builds sort keys for spreadsheet rows.
+
+        Each specification is a column, or a tuple of (column, reverse) or
+        (column, reverse, collation). collation is 'number' or 'text'.
+
+            'number'    --> cells compare as floats. Cells that are not
+                            numbers follow the numbers as text, and blank
+                            cells always come last.
+            'text'      --> cells compare as strings.
+
+        User Accesible Methods:
+
+            __call__(row (list))
+                --> Gets the sort key for a row.
+
+            components()
+                --> Gets one key function per specification.
+    """
+
+    NUMBER = "number"
+    TEXT = "text"
+
+    def __init__(self, keys, headers=None, collate=None):
+        """
+            Initializes an instance of this class
+
+            Attributes:
+                keys (list): sort specifications, see class notes
+                headers (list): column names used to resolve named columns
+                collate (function): gets the collation of a column index for
+                                    specifications that do not name one
+
+            Raises:
+                ValueError: if a named column is not in headers
+        """
+        self.columns = list()
+        self.reverse = list()
+        self.collations = list()
+
+        for column, reverse, collation in self.parse(keys):
+
+            if not isinstance(column, int):
+                if headers is None or column not in headers:
+                    raise ValueError("'{0}' is not a column in this "
+                                     "spreadsheet".format(column))
+                column = headers.index(column)
+
+            if collation is None and collate is not None:
+                collation = collate(column)
+
+            self.columns.append(column)
+            self.reverse.append(reverse)
+            self.collations.append(collation or self.TEXT)
+
+        self.keys = self.components()
+
+    def __call__(self, row):
+        """
+            Get the sort key for a row
+
+            Attributes:
+                row (list): row as a list
+
+            Returns:
+                tuple: key for the row
+        """
+        return tuple([key(row[column] if column < len(row) else "")
+                      for key, column in zip(self.keys, self.columns)])
+
+    def components(self):
+        """
+            Get one key function per sort specification
+
+            Returns:
+                list: functions taking a cell and returning its key
+        """
+        components = list()
+
+        for reverse, collation in zip(self.reverse, self.collations):
+
+            if collation == self.NUMBER:
+                components.append(self.numberKey(reverse))
+            elif reverse:
+                components.append(Descending)
+            else:
+                components.append(lambda cell: cell)
+
+        return components
+
+    def numberKey(self, reverse=False):
+        """
+            Get a key function that compares cells as numbers
+
+            Attributes:
+                reverse (bool): sort largest numbers first if True
+
+            Returns:
+                function: key function for a cell
+        """
+        sign = -1.0 if reverse else 1.0
+        text = Descending if reverse else (lambda cell: cell)
+
+        def key(cell):
+            if cell == "":
+                return (2, "")
+
+            try:
+                return (0, sign * float(cell))
+            except(ValueError):
+                return (1, text(cell))
+
+        return key
+
+    def parse(self, keys):
+        """
+            Get every sort specification as a (column, reverse, collation)
+            tuple
+
+            Attributes:
+                keys (list): sort specifications
+
+            Returns:
+                list: tuples of (column, reverse, collation)
+        """
+        if not isinstance(keys, list):
+            keys = [keys]
+
+        parsed = list()
+
+        for key in keys:
+            if not isinstance(key, tuple):
+                key = (key,)
+
+            key = key + (False, None)[len(key) - 1:]
+            parsed.append(key[:3])
+
+        return parsed
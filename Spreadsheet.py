@@ -16,6 +16,7 @@
 #
 # This class is directly inherited by the following classes:
 #       - SpreadsheetPlus.py
+#       - MappedSpreadsheet.py
 #
 # Updates:
 # 1. [2015/12/04] - added: method open().
@@ -51,6 +52,55 @@
 #                            correct headers now.
 #                            self.initialized now works for all load cases.
 # 11.[2017/02/19] - Added getState() method and revertTranspose() methods.
+# 12.[2026/10/18] - moved data into a ColumnStore. self.spreadsheet is now a
+#                   view over the store, so toRows(), toColumns() and
+#                   transpose() no longer copy the table.
+# 13.[2026/10/18] - getColumnIndex() looks up column names in a cached
+#                   header index, cleared by header-changing methods.
+# 14.[2026/10/18] - added: iterRows() to stream rows from a file in buffered
+#                   chunks. load() now reads through iterRows().
+# 15.[2026/10/18] - added: numeric(), getColumnType() and inferTypes().
+#                   Numeric columns are converted once into a NumericColumn
+#                   and cached; column(number=True) reads from the cache.
+# 16.[2026/10/18] - sort() takes several keys and sorts numeric columns as
+#                   numbers. added: sortFile() for external merge sorts.
+# 17.[2026/10/18] - save() writes rows in batches instead of one string.
+#                   added: iterLines(), column projection and header option
+#                   for save().
+# 18.[2026/10/18] - added: offsets parameter to fill() to build a column of
+#                   formulas from a template in one pass.
+# 19.[2026/10/18] - transpose() returns the spreadsheet's new view and no
+#                   longer pads. Short rows and columns are padded when read.
+# 20.[2026/10/18] - added: batch() to defer refresh() over many edits.
+# 21.[2026/10/18] - added: createIndex(), dropIndex(), getIndex(), findRows(),
+#                   findRange() and findPrefix() for indexed lookups.
+#                   getRowIndex() can look up a value in an indexed column.
+# 22.[2026/10/18] - added: where parameter to load() and iterRows() to skip
+#                   rows before they are split. added: readLines() and
+#                   lineFilter().
+# 23.[2026/10/18] - added: groupBy() and groupFile() to aggregate groups of
+#                   rows in one pass.
+# 24.[2026/10/18] - added: join() for inner, left and anti hash joins, and
+#                   records().
+# 25.[2026/10/18] - added: cache parameter to load() to reuse columns saved
+#                   in a binary sidecar file by ColumnCache.
+# 26.[2026/10/18] - added: workers parameter to load() to parse byte ranges
+#                   of the file in a process pool. added: splitRanges() and
+#                   parseRange().
+# 27.[2026/10/18] - added: quoted parameter to load() and iterRows() to parse
+#                   quoted cells with the csv module. added: iterQuotedRows()
+#                   and rowFilter().
+# 28.[2026/10/18] - toString() joins lines once instead of adding strings.
+#                   added: head(), tail(), page() and render() to show part
+#                   of a spreadsheet. __repr__() shows the head of large
+#                   spreadsheets.
+# 29.[2026/10/18] - the header index is keyed on the store version, so any
+#                   write, including one to row 0 through a view, rebuilds
+#                   it. added: getVersion().
+# 30.[2026/10/18] - added: quoted parameter to save() and iterLines() to
+#                   quote cells with the csv module. iterQuotedRows() splits
+#                   blocks without quotes. added: iterSplitRows() and
+#                   readBlocks().
 # - - - - - - - - - - - - -
 
 __author__ = "Glenn Abastillas"
@@ -61,6 +111,23 @@ __license__ = "Free"
 __version__ = "1.0.0"
 __maintainer__ = "Glenn Abastillas"
 
+from contextlib import contextmanager
+from cStringIO import StringIO
+import csv
+from itertools import chain, islice, izip_longest
+from operator import itemgetter
+import heapq
+import multiprocessing
+import os
+import tempfile
+
+from ColumnCache import ColumnCache
+from ColumnIndex import HashIndex, SortedIndex
+from ColumnStore import ColumnStore
+from GroupBy import GroupBy
+from NumericColumn import NumericColumn
+from SortKey import SortKey
+
 
 def preserve_transpose(function):
     """
@@ -85,6 +152,38 @@ def preserve_transpose(function):
     return preserve
 
 
+def parseRange(task):
+    """
+    Parses a byte range of a spreadsheet file in a worker process. This is a
+    module-level function so that multiprocessing can pickle it.
+
+    Args:
+        task (tuple): (filePath, start, end, delimiter, header, where) where
+                      header is the first line of the file, used by where
+
+    Returns:
+        list: columns of the rows in the range, as tuples
+    """
+    filePath, start, end, delimiter, header, where = task
+
+    with open(filePath, 'rb') as fileIn:
+        fileIn.seek(start)
+        text = fileIn.read(end - start)
+
+    # Match the universal newlines of Spreadsheet.readLines()
+    lines = text.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+
+    if lines[-1] == "":
+        lines.pop()
+
+    if where is not None:
+        keep = Spreadsheet.lineFilter(where, header, delimiter)
+        lines = [line for line in lines if keep(line)]
+
+    return list(izip_longest(*[line.split(delimiter) for line in lines],
+                             fillvalue=""))
+
+
 class Spreadsheet(object):
 
     """
@@ -123,9 +222,12 @@ class Spreadsheet(object):
                 addToColumn(column (int), data (str, int))
                     --> Adds value to last empty cell in column.
 
-                fill(column (int), fillWith (str, int))
+                fill(column (int), fillWith (str, int), offsets (list))
                     --> Fills entire specified column with a single value
                         leaving the header intact.
+                    --> Fills column with formulas if offsets provided, e.g.,
+                        fill(3, "=A{0}*B{1}", offsets=[1, 0]) puts "=A2*B1"
+                        in row 1, "=A3*B2" in row 2, etc.
 
                 column(column (int), data (list),
                        number (bool), header (bool))
@@ -145,6 +247,71 @@ class Spreadsheet(object):
                 getColumnName(column (int))
                     --> Gets name of column if index of column is known.
 
+                createIndex(column (str, int), ordered (bool),
+                            collation (str))
+                    --> Builds an index on a column and keeps it. A hash
+                        index is built unless ordered is True, which builds
+                        a sorted index for range and prefix queries.
+                    --> Indexes are updated when row() adds a row and are
+                        rebuilt on their next use after other edits, e.g.,
+                        removeRow() or sort().
+
+                dropIndex(column (str, int))
+                    --> Removes the indexes on a column, or all indexes if
+                        column is None.
+
+                findRows(column (str, int), value (str))
+                    --> Gets the indices of rows whose cell equals value.
+
+                findRange(column (str, int), low, high)
+                    --> Gets the indices of rows whose cell is from low to
+                        high, in order of value.
+
+                findPrefix(column (str, int), prefix (str))
+                    --> Gets the indices of rows whose cell starts with
+                        prefix, in order of value.
+
+                groupBy(columns (list))
+                    --> Groups rows by the values of columns. Use agg() on
+                        the result to get a new Spreadsheet with one row per
+                        group, e.g., groupBy("site").agg("count",
+                        ("score", "mean")). Aggregates are count, sum, mean,
+                        min, max and distinct.
+
+                groupFile(filePath (str), columns (list), delimiter (str),
+                          where (function, dict))
+                    --> Groups rows of a file like groupBy(), streaming the
+                        file instead of loading it.
+
+            Methods for JOINS:
+                join(other (Spreadsheet, list, str), on (list), how (str),
+                     otherOn (list), delimiter (str))
+                    --> Gets a new Spreadsheet joining this spreadsheet to
+                        other on key columns. how is 'inner', 'left' or
+                        'anti'. A hash table is built on the smaller side and
+                        the larger side is streamed. other may be a
+                        Spreadsheet, a list of rows or a file path.
+
+                records()
+                    --> Yields each row, header first, as a tuple.
+
+                getColumnType(column (str, int))
+                    --> Gets 'number' if every non-blank cell in the column is
+                        a number, else 'text'.
+
+                inferTypes()
+                    --> Gets the type of every column and caches the numeric
+                        ones.
+
+                numeric(column (str, int))
+                    --> Gets column as a NumericColumn with a mask for blank
+                        cells. The conversion is cached until the column
+                        changes. Use its sum(), mean(), min() and max().
+
+                indexHeaders()
+                    --> Gets a dictionary of column names to column indices.
+                        getColumnIndex() caches it until headers change.
+
                 newColumn(name (str), fillWith (str, int))
                     --> Creates a new column.
 
@@ -164,27 +331,55 @@ class Spreadsheet(object):
                     --> Sets value at specified row and column if data present.
 
             Methods for DATA:
+                batch()
+                    --> Context manager for many edits at once. refresh() is
+                        run once when the outermost batch ends, e.g.,
+                        with sheet.batch(): sheet.addToColumn(0, "x") ...
+
                 getHeaders()
                     --> Gets the headers in this spreadsheet.
 
                 getSpreadsheet()
                     --> Gets the spreadsheet data.
 
+                getVersion()
+                    --> Gets a number that changes with every data write.
+
                 setData(data (Spreadsheet, list))
                     --> Replaces the current spreadsheet with new data.
 
                 transpose()
                     --> Transposes spreadsheet so rows --> columns and
-                        vice-versa.
+                        vice-versa. Returns the spreadsheet's new view; no
+                        data is copied.
 
                 toString(fileToString (str))
                     --> Returns a formatted string of the spreadsheet or data
                         specified.
 
-                sort(column (int), reverse (bool), hasTitle (bool))
+                head(rows (int)), tail(rows (int))
+                    --> Returns the header and the first (or last) rows as a
+                        formatted string. Columns are as wide as the cells
+                        shown, up to MAX_WIDTH.
+
+                page(number (int), size (int))
+                    --> Returns the header and one page of rows as a
+                        formatted string. Page 0 is the first page.
+
+                render(positions (list))
+                    --> Returns the rows at positions as a formatted string.
+
+                sort(column (int), reverse (bool), hasTitle (bool),
+                     keys (list))
                     --> Sorts entire spreadsheet by column. Reverse sort done
                         if reverse is True. Title is also sorted if hasTitle
-                        is True.
+                        is False. keys sorts by several columns, each a column
+                        or a tuple of (column, reverse, collation).
+
+                sortFile(filePath (str), keys (list), delimiter (str),
+                         hasTitle (bool), runSize (int))
+                    --> Sorts a file too large for memory with an external
+                        merge sort. Yields sorted rows for save().
 
             Methods for FILE PATHS:
                 filePath(filePath (str), delimiter (str))
@@ -196,11 +391,74 @@ class Spreadsheet(object):
                 prepareForSave(spreadsheet (list), delimiter (str))
                     --> Formats specified spreadsheet for saving.
 
+                iterLines(spreadsheet (list), delimiter (str),
+                          columns (list), quoted (bool))
+                    --> Yields each row of specified spreadsheet as a line
+                        of text, keeping only the columns specified. Cells
+                        are quoted as needed if quoted is True.
+
+                save(savePath (str), savedata (list), saveType (str),
+                     delimiter (str), columns (list), header (bool),
+                     quoted (bool))
+                    --> Writes the spreadsheet (or savedata) to savePath in
+                        batches of SAVE_BATCH rows. saveType 'a' appends.
+
                 open(filePath)
                     --> Opens specified file and returns a list.
 
-                load(filePath (str), delimiter (str))
+                iterRows(filePath (str), delimiter (str), skipHeader (bool),
+                         chunkSize (int), where (function, dict),
+                         quoted (bool))
+                    --> Yields rows of specified file one at a time, reading
+                        chunkSize characters at a time. Lines rejected by
+                        where are skipped without being split.
+                    --> Parses quoted cells with iterQuotedRows() if quoted
+                        is True, else splits lines with iterSplitRows().
+
+                iterSplitRows(filePath (str), delimiter (str),
+                              skipHeader (bool), chunkSize (int),
+                              where (function, dict))
+                    --> Yields rows of specified file split at delimiter.
+
+                iterQuotedRows(filePath (str), delimiter (str),
+                               skipHeader (bool), where (function, dict),
+                               chunkSize (int))
+                    --> Yields rows of specified file, parsing lines with a
+                        quote with the csv module. Cells may be quoted with
+                        '"' and hold delimiters, quotes ('""') and line
+                        breaks.
+
+                readLines(filePath (str), chunkSize (int))
+                    --> Yields lines of specified file without line endings.
+
+                readBlocks(filePath (str), chunkSize (int))
+                    --> Yields the lines of specified file a chunk at a time.
+
+                lineFilter(where (function, dict), header (str),
+                           delimiter (str))
+                    --> Gets a function that tells if a raw line passes
+                        where, e.g., where={"site": "SITE01"} or
+                        where={"dice": set(["CH001", "CH002"])}.
+
+                rowFilter(where (function, dict), headers (list),
+                          delimiter (str))
+                    --> Gets a function that tells if a parsed row passes
+                        where.
+
+                load(filePath (str), delimiter (str), typed (bool),
+                     where (function, dict), cache (bool, str),
+                     workers (int), quoted (bool))
                     --> Opens specified file and sets state for Spreadsheet.
+                        Only the header and the rows passing where are kept.
+                    --> Reads the columns from a binary cache file if cache
+                        is True (or a cache path) and the cache is fresh;
+                        otherwise parses the file and writes the cache.
+                    --> Parses byte ranges of the file in workers processes
+                        if workers is more than 1.
+
+                splitRanges(filePath (str), count (int))
+                    --> Gets the end of the header line and about count byte
+                        ranges of the rest of the file, split at newlines.
 
                 refresh()
                     --> Adds addition cell padding if rows or columns are of
@@ -213,6 +471,26 @@ class Spreadsheet(object):
 
     COLUMN_ALPHA = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
 
+    # number of characters read at a time by iterRows()
+    CHUNK_SIZE = 1048576
+
+    # number of rows sorted in memory at a time by sortFile()
+    RUN_SIZE = 100000
+
+    # number of rows written at a time by save()
+    SAVE_BATCH = 10000
+
+    # rows shown by head() and tail(), rows per page(), and widest column
+    PREVIEW_ROWS = 10
+    PAGE_SIZE = 50
+    MAX_WIDTH = 40
+
+    # spreadsheets with more rows are shown by __repr__() with head()
+    REPR_ROWS = 50
+
+    # kinds of join() supported
+    JOINS = ("inner", "left", "anti")
+
     def __init__(self, filePath=None, savePath=None,
                  delimiter="\t", columns=["columnName"]):
         """
@@ -225,8 +503,25 @@ class Spreadsheet(object):
                 columns (array): list of column names for a blank spreadsheet
         """
 
-        # list containing spreadsheet
-        self.spreadsheet = list()
+        # columnar storage for the spreadsheet's data
+        self.store = ColumnStore()
+
+        # spreadsheet as rows (False) or columns (True)
+        self.transposed = False
+
+        # (store version, column name --> column index), built on demand by
+        # getColumnIndex()
+        self.headerIndex = None
+
+        # column index --> (cells, length, store version, NumericColumn)
+        self.numericColumns = dict()
+
+        # (column index, ordered) --> (cells, store version, index)
+        self.indexes = dict()
+
+        # number of open batch() contexts, and whether a refresh() is owed
+        self.batchDepth = 0
+        self.refreshPending = False
 
         # location of the spreadsheet
         self.filePath = filePath
@@ -240,9 +535,6 @@ class Spreadsheet(object):
         # spreadsheet initialized?
         self.initialized = False
 
-        # spreadsheet as rows (False) or columns (True)
-        self.transposed = False
-
         # Used for next() function
         self.iter_index = 0
 
@@ -252,6 +544,29 @@ class Spreadsheet(object):
         else:
             self.spreadsheet.extend([columns])
 
+    @property
+    def spreadsheet(self):
+        """
+            Returns this spreadsheet's data as a view over self.store. The
+            view is a list of columns if transposed, else a list of rows.
+        """
+        if self.transposed:
+            return self.store.columnsView()
+        return self.store.rows()
+
+    @spreadsheet.setter
+    def spreadsheet(self, data):
+        """
+            Replaces this spreadsheet's data
+
+            Attributes:
+                data (list): list of columns if transposed, else rows
+        """
+        if self.transposed:
+            self.store.setColumns(data)
+        else:
+            self.store.setRows(data)
+
     def __getitem__(self, key):
         """
             Enables list[n] syntax
@@ -285,8 +600,15 @@ class Spreadsheet(object):
 
     def __repr__(self):
         """
-            Formats the string representation of this object
+            Formats the string representation of this object. Large
+            spreadsheets show only their first rows.
         """
+        count = self.getRowCount()
+
+        if count > self.REPR_ROWS:
+            return "{0}... {1} more rows\n".format(self.head(),
+                                                  count - self.PREVIEW_ROWS)
+
         return self.toString()
 
     def next(self):
@@ -320,6 +642,7 @@ class Spreadsheet(object):
             columnForAppending.append(data)
         else:
             columnForAppending[lastEmptyCellIndex] = data
+
         # -- self.revertTranspose(state)
 
     @preserve_transpose
@@ -337,8 +660,167 @@ class Spreadsheet(object):
             self.spreadsheet[row].extend(data)
         else:
             self.spreadsheet[row].append(data)
+        self.headerIndex = None
         # -- self.revertTranspose(state)
 
+    def createIndex(self, column, ordered=False, collation=None):
+        """
+            Build an index on a column. The index is kept and used by
+            findRows(), findRange(), findPrefix() and getRowIndex().
+
+            Attributes:
+                column (str, int): index or name of column
+                ordered (bool): build a sorted index if True, else a hash
+                                index
+                collation (str): 'number' or 'text' for a sorted index. The
+                                 column's type is used if None.
+
+            Returns:
+                HashIndex or SortedIndex: the new index
+        """
+        self.dropIndex(column)
+        return self.getIndex(column, ordered, collation)
+
+    def dropIndex(self, column=None):
+        """
+            Remove the indexes on a column
+
+            Attributes:
+                column (str, int): index or name of column. All indexes are
+                                   removed if None.
+        """
+        if column is None:
+            self.indexes = dict()
+            return
+
+        index = self.getColumnIndex(column)
+        self.indexes.pop((index, False), None)
+        self.indexes.pop((index, True), None)
+
+    def findPrefix(self, column, prefix):
+        """
+            Get the rows whose cell in a column starts with a prefix. A
+            sorted text index is built on the column if it has none.
+
+            Attributes:
+                column (str, int): index or name of column
+                prefix (str): start of the values to find
+
+            Returns:
+                list: indices of matching rows, in order of value
+        """
+        return self.getIndex(column, True, SortedIndex.TEXT).prefix(prefix)
+
+    def findRange(self, column, low=None, high=None):
+        """
+            Get the rows whose cell in a column is from low to high,
+            inclusive. A sorted index is built on the column if it has none.
+
+            Attributes:
+                column (str, int): index or name of column
+                low (str, float): smallest value to find, None for no limit
+                high (str, float): largest value to find, None for no limit
+
+            Returns:
+                list: indices of matching rows, in order of value
+        """
+        return self.getIndex(column, True).range(low, high)
+
+    def findRows(self, column, value):
+        """
+            Get the rows whose cell in a column equals a value. A hash index
+            is built on the column if it has none.
+
+            Attributes:
+                column (str, int): index or name of column
+                value (str): value to look up
+
+            Returns:
+                list: indices of matching rows, in row order
+        """
+        return self.getIndex(column).find(value)
+
+    def getIndex(self, column, ordered=False, collation=None):
+        """
+            Get the index on a column, building it if the column has none or
+            if the column changed since it was built
+
+            Attributes:
+                column (str, int): index or name of column
+                ordered (bool): get a sorted index if True, else a hash index
+                collation (str): 'number' or 'text' for a sorted index. If
+                                 None, the existing index's collation is
+                                 kept, even when the index is rebuilt, so
+                                 a number index leaves out text added later
+                                 rather than turning into a text index. A
+                                 new index uses the column's type.
+
+            Returns:
+                HashIndex or SortedIndex: index on the column
+        """
+        index = self.getColumnIndex(column)
+        # Edits pad only the columns they touch, so pad this one to full size
+        cells = self.store.padColumn(index, self.store.rowCount())
+        version = self.store.version
+        cached = self.indexes.get((index, ordered))
+
+        if cached is not None:
+            if collation is None and ordered:
+                collation = cached[2].collation
+
+            # Reuse the index if the column has not changed since
+            if (cached[0] is cells and cached[1] == version and
+                    (not ordered or cached[2].collation == collation)):
+                return cached[2]
+
+        if ordered:
+            if collation is None:
+                collation = self.getColumnType(index)
+            columnIndex = SortedIndex(cells, collation)
+        else:
+            columnIndex = HashIndex(cells)
+
+        self.indexes[(index, ordered)] = (cells, version, columnIndex)
+        return columnIndex
+
+    def indexRow(self, version, row):
+        """
+            Add a new row to the indexes that were current before it was
+            added, so they do not need to be rebuilt. A number index leaves
+            out a new cell that is not a number.
+
+            Attributes:
+                version (int): store version before the row was added
+                row (int): index of the new row
+        """
+        columns = self.store.columns
+
+        for key, (cells, built, columnIndex) in self.indexes.items():
+            if (built == version and key[0] < len(columns) and
+                    columns[key[0]] is cells):
+                columnIndex.add(cells[row], row)
+                self.indexes[key] = (cells, self.store.version, columnIndex)
+
+    @contextmanager
+    def batch(self):
+        """
+            Group edits so that padding and normalization run once at the end
+            instead of after every edit. Batches can be nested.
+
+            Returns:
+                Spreadsheet: this spreadsheet, for use in a with statement
+        """
+        self.batchDepth += 1
+
+        try:
+            yield self
+        finally:
+            self.batchDepth -= 1
+
+            if self.batchDepth == 0 and self.refreshPending:
+                self.refreshPending = False
+                self.refresh()
+
     @preserve_transpose
     def cell(self, row, column, data=None):
         """
@@ -350,11 +832,14 @@ class Spreadsheet(object):
                 data (str): data to fill cell
         """
         if data is None:
-            return self.getRow(row)[column]
+            return self.row(row)[column]
         else:
             # -- state = self.getState()
             self.toRows()
             self.spreadsheet[row][column] = data
+
+            if self.store.rowIndex(row) == 0:
+                self.headerIndex = None
             # -- self.revertTranspose(state)
 
     def column(self, column=0, data=None, number=False, header=False):
@@ -403,13 +888,14 @@ class Spreadsheet(object):
                     new_column = column_head + data
 
                 self.spreadsheet[index] = new_column
+                self.headerIndex = None
                 self.refresh()
 
             else:
 
                 # Convert cell values to numbers
                 if number is True:
-                    body = [float(row) for row in column_body if row != '']
+                    body = self.numeric(index).present().tolist()
 
                     column = column_head + body
 
@@ -427,6 +913,7 @@ class Spreadsheet(object):
         elif isinstance(column, list):
 
             self.spreadsheet.append(column)
+            self.headerIndex = None
             self.refresh()
 
         # If newColumn is none, raise an error
@@ -454,16 +941,21 @@ class Spreadsheet(object):
         else:
             self.load(filePath, delimiter)
 
-    def fill(self, column=-1, fillWith=" ", skipTitle=True, cellList=None):
+    def fill(self, column=-1, fillWith=" ", skipTitle=True, cellList=None,
+             offsets=None):
         """
             Fills a column with text
 
             Attributes:
                 column (int): column to fill (index or column name)
-                fillWith (str): datas of new column
+                fillWith (str): datas of new column, or a formula template
+                                if offsets are specified
                 cellList (array): list of tuples (cell, offset) to
                                   insert into the fillWith formula
                 skipTitle (bool): start filling on the second row
+                offsets (list): row offsets for the {0}, {1}, ... markers in
+                                the fillWith template. Marker n in row i is
+                                replaced with i + offsets[n].
         """
         # Transpose spreadsheet to edit column
         state = self.getState()
@@ -483,8 +975,22 @@ class Spreadsheet(object):
             append(self.spreadsheet[column][0])
             initialIndex = 1
 
+        # if there are offsets, build every formula from the template at once
+        if offsets is not None:
+
+            columnForLoop = len(self.spreadsheet[column])
+
+            # one sequence of row numbers per marker in the template
+            rowNumbers = [xrange(initialIndex + offset, columnForLoop + offset)
+                          for offset in offsets]
+
+            if rowNumbers:
+                newColumn.extend(map(fillWith.format, *rowNumbers))
+            else:
+                newColumn.extend([fillWith] * (columnForLoop - initialIndex))
+
         # if there is a a cellList, there are values to replace
-        if cellList is not None:
+        elif cellList is not None:
 
             # items in cellList re tuples
             # the first part is the reference (e.g., "$A1" --> "$A{0}")
@@ -534,7 +1040,6 @@ class Spreadsheet(object):
                     # fillWithToReplace = fillWithToReplace.replace(marker,
                     #                                               reference)
                     fillWithToReplace = reference
-                    print fillWithToReplace
 
                 append(fillWithToReplace)
 
@@ -633,11 +1138,18 @@ class Spreadsheet(object):
 
         # If 'column' is a string, return it's index
         else:
-            state = self.getState()
-            self.toRows()
-            columnIndex = self.spreadsheet[0].index(column)
-            self.revertTranspose(state)
-            return columnIndex
+            version = self.getVersion()
+
+            # Any write may have changed the headers, so rebuild the index
+            # if the data changed since it was built
+            if self.headerIndex is None or self.headerIndex[0] != version:
+                self.headerIndex = (version, self.indexHeaders())
+
+            try:
+                return self.headerIndex[1][column]
+            except(KeyError):
+                raise ValueError("'{0}' is not a column in this spreadsheet"
+                                 .format(column))
 
     @preserve_transpose
     def getColumnName(self, column):
@@ -657,14 +1169,34 @@ class Spreadsheet(object):
         # -- self.revertTranspose(state)
         return columnName
 
+    def getColumnType(self, column):
+        """
+            Get the type of the values in a column
+
+            Attributes:
+                column (str, int): index or name of column
+
+            Returns:
+                str: 'number' if all non-blank cells are numbers, else 'text'
+        """
+        try:
+            numeric = self.numeric(column)
+        except(ValueError):
+            return "text"
+
+        if numeric.count() == 0:
+            return "text"
+
+        return "number"
+
     @preserve_transpose
     def getHeaders(self):
         """
             Return headers for columns in the spreadsheet
         """
         # -- state = self.getState()
-        self.toColumns()
-        headers = [column[0] for column in self.spreadsheet]
+        headers = [column[0] if column else ""
+                   for column in self.store.columns]
         # -- self.revertTranspose(state)
         return headers
 
@@ -680,26 +1212,258 @@ class Spreadsheet(object):
         return rowCount
 
     @preserve_transpose
-    def getRowIndex(self, data):
+    def getRowIndex(self, data, column=None):
         """
             Get the index of a specified row
 
             Attributes:
                 data (str):    cell data whose row to get
+                column (str, int): if specified, find the first row whose
+                                   cell in this column equals data, using
+                                   the column's index
 
             Returns:
                 int: index of row
                 None: if data does not match row[0]
         """
+        if column is not None:
+            rows = self.findRows(column, data)
+            return rows[0] if rows else None
+
         # -- state = self.getState()
         self.toRows()
 
-        for row in self.spreadsheet:
+        for i, row in enumerate(self.spreadsheet):
             if data in row[0]:
-                return self.spreadsheet.index(row)
+                return i
         # -- self.revertTranspose(state)
         return None
 
+    def join(self, other, on, how="inner", otherOn=None, delimiter="\t"):
+        """
+            Join this spreadsheet (the left side) to other (the right side)
+            on key columns with a hash table
+
+            inner   --> rows with a match on both sides, one row per pair.
+            left    --> inner rows, plus left rows with no match, with blank
+                        right cells.
+            anti    --> left rows with no match on the right.
+
+            The hash table is built on the side with fewer rows; the other
+            side is read once. If the left side is streamed, rows come out in
+            left order. Otherwise they come out in right order, and unmatched
+            left rows follow in left order. A file path is always streamed.
+
+            Attributes:
+                other (Spreadsheet): right side
+                other (list): right side as rows, header first
+                other (str): path of a file to stream as the right side
+                on (str, int, list): key column(s) of this spreadsheet
+                how (str): 'inner', 'left' or 'anti'
+                otherOn (str, int, list): key column(s) of other. Same as on
+                                          if None.
+                delimiter (str): delimiter of the file at other
+
+            Returns:
+                Spreadsheet: all columns of this spreadsheet, then the
+                             columns of other except its key columns (none
+                             for an anti join)
+
+            Raises:
+                ValueError: if how is unknown, a column name is not found,
+                            or on and otherOn name different numbers of
+                            columns
+        """
+        if how not in self.JOINS:
+            raise ValueError("'{0}' is not a join. Use one of: "
+                             "{1}".format(how, ", ".join(self.JOINS)))
+
+        if not isinstance(on, list):
+            on = [on]
+
+        if otherOn is None:
+            otherOn = on
+        elif not isinstance(otherOn, list):
+            otherOn = [otherOn]
+
+        if len(on) != len(otherOn):
+            raise ValueError("on and otherOn must name the same number of " +
+                             "columns")
+
+        # Get the rows of each side, header first
+        left = self.records()
+        leftSize = self.getRowCount()
+
+        if isinstance(other, Spreadsheet):
+            right = other.records()
+            rightSize = other.getRowCount()
+        elif isinstance(other, list):
+            right = iter(other)
+            rightSize = len(other) - 1
+        else:
+            right = self.iterRows(other, delimiter)
+            rightSize = None
+
+        leftHeaders = list(next(left, []))
+        rightHeaders = list(next(right, []))
+
+        def resolve(headers, column):
+            if isinstance(column, int):
+                return column
+            if column not in headers:
+                raise ValueError("'{0}' is not a column in this "
+                                 "spreadsheet".format(column))
+            return headers.index(column)
+
+        leftKey = itemgetter(*[resolve(leftHeaders, c) for c in on])
+        rightColumns = [resolve(rightHeaders, c) for c in otherOn]
+        rightKey = itemgetter(*rightColumns)
+        rightWidth = max(rightColumns + [len(rightHeaders) - 1]) + 1
+
+        # Right cells kept in the output
+        kept = [j for j in xrange(len(rightHeaders)) if j not in rightColumns]
+        if len(kept) > 1:
+            part = itemgetter(*kept)
+        else:
+            part = lambda row: tuple([row[j] for j in kept])
+
+        blank = ("",) * len(kept)
+
+        def padded(rows):
+            for row in rows:
+                if len(row) < rightWidth:
+                    row = tuple(row) + ("",) * (rightWidth - len(row))
+                yield row
+
+        right = padded(right)
+        output = list()
+        append = output.append
+
+        if how == "anti":
+            append(leftHeaders)
+        else:
+            append(leftHeaders + [rightHeaders[j] for j in kept])
+
+        if rightSize is not None and rightSize <= leftSize:
+
+            # Build on the right and stream the left
+            if how == "anti":
+                keys = set(rightKey(row) for row in right)
+
+                for row in left:
+                    if leftKey(row) not in keys:
+                        append(list(row))
+
+            else:
+                table = dict()
+
+                for row in right:
+                    table.setdefault(rightKey(row), []).append(part(row))
+
+                for row in left:
+                    matches = table.get(leftKey(row))
+
+                    if matches is not None:
+                        for match in matches:
+                            append(list(row) + list(match))
+                    elif how == "left":
+                        append(list(row) + list(blank))
+
+        else:
+
+            # Build on the left and stream the right
+            rows = list(left)
+            table = dict()
+            matched = set()
+
+            for i, row in enumerate(rows):
+                table.setdefault(leftKey(row), []).append(i)
+
+            for row in right:
+                key = rightKey(row)
+                positions = table.get(key)
+
+                if positions is None:
+                    continue
+
+                matched.add(key)
+
+                if how != "anti":
+                    cells = list(part(row))
+
+                    for i in positions:
+                        append(list(rows[i]) + cells)
+
+            if how != "inner":
+                for row in rows:
+                    if leftKey(row) not in matched:
+                        append(list(row) + list(blank if how == "left"
+                                                else ()))
+
+        result = Spreadsheet()
+        result.setData(output, asRows=False)
+        return result
+
+    def groupBy(self, columns):
+        """
+            Group the rows of this spreadsheet by the values of columns
+
+            Attributes:
+                columns (list): names or indices of columns to group by
+
+            Returns:
+                GroupBy: groups to aggregate with agg()
+        """
+        store = self.store
+
+        def rows(indices):
+            cells = [islice(store.columns[j], 1, None) for j in indices]
+            return izip_longest(*cells, fillvalue="")
+
+        return GroupBy(self.getHeaders(), columns, rows)
+
+    @staticmethod
+    def groupFile(filePath, columns, delimiter="\t", where=None):
+        """
+            Group the rows of a file by the values of columns. The file is
+            read once, when agg() is called, and is never held in memory.
+
+            Attributes:
+                filePath (str): spreadsheet file to read
+                columns (list): names or indices of columns to group by
+                delimiter (str): delimiter of document at filePath
+                where (function, dict): keep only the rows passing this
+                                        filter, see lineFilter()
+
+            Returns:
+                GroupBy: groups to aggregate with agg()
+        """
+        headers = next(Spreadsheet.iterRows(filePath, delimiter), [])
+
+        def rows(indices):
+            last = max(indices)
+            get = itemgetter(*indices)
+
+            for row in Spreadsheet.iterRows(filePath, delimiter, True,
+                                            where=where):
+                if len(row) <= last:
+                    row += [""] * (last + 1 - len(row))
+
+                yield get(row)
+
+        return GroupBy(headers, columns, rows)
+
+    def indexHeaders(self):
+        """
+            Map each column name to its index. If names repeat, the first
+            column with that name is used.
+
+            Returns:
+                dict: column name --> column index
+        """
+        headers = self.getHeaders()
+        return dict((headers[i], i) for i in xrange(len(headers) - 1, -1, -1))
+
     def getSpreadsheet(self):
         """
             Get this Spreadsheet
@@ -716,6 +1480,26 @@ class Spreadsheet(object):
         """
         return self.transposed
 
+    def getVersion(self):
+        """
+            Get the version of this spreadsheet's data, which changes with
+            every write to it
+
+            Returns:
+                int: version of self.store
+        """
+        return self.store.version
+
+    def inferTypes(self):
+        """
+            Determine the type of every column. Numeric columns are converted
+            and cached for numeric() and column(number=True).
+
+            Returns:
+                list: 'number' or 'text' for each column
+        """
+        return [self.getColumnType(i) for i in xrange(self.store.columnCount())]
+
     def isInitialized(self):
         """
             Returns state of self.initialized
@@ -734,13 +1518,399 @@ class Spreadsheet(object):
         """
         return self.transposed
 
-    def load(self, filePath=None, delimiter="\t"):
+    @staticmethod
+    def iterRows(filePath, delimiter="\t", skipHeader=False, chunkSize=None,
+                 where=None, quoted=False):
+        """
+            Yield the rows of a file one at a time. The file is read in
+            buffered chunks, so memory use is bounded by chunkSize rather
+            than by the size of the file.
+
+            Attributes:
+                filePath (str): spreadsheet file to read
+                delimiter (str): delimiter of document at filePath
+                skipHeader (bool): do not yield the first (header) row
+                chunkSize (int): number of characters to read at a time
+                where (function, dict): filter for data rows, see
+                                        lineFilter(). The header row is
+                                        always kept.
+                quoted (bool): parse quoted cells, see iterQuotedRows()
+
+            Returns:
+                generator: rows as lists, in the same form as load()
+        """
+        # Hand back the parser's own generator, so rows are not passed
+        # through a second one
+        if quoted:
+            return Spreadsheet.iterQuotedRows(filePath, delimiter, skipHeader,
+                                              where, chunkSize)
+
+        return Spreadsheet.iterSplitRows(filePath, delimiter, skipHeader,
+                                         chunkSize, where)
+
+    @staticmethod
+    def iterSplitRows(filePath, delimiter="\t", skipHeader=False,
+                      chunkSize=None, where=None):
+        """
+            Yield the rows of a file split at delimiter, see iterRows()
+
+            Attributes:
+                filePath (str): spreadsheet file to read
+                delimiter (str): delimiter of document at filePath
+                skipHeader (bool): do not yield the first (header) row
+                chunkSize (int): number of characters to read at a time
+                where (function, dict): filter for data rows, see
+                                        lineFilter(). The header row is
+                                        always kept.
+
+            Returns:
+                generator: rows as lists, in the same form as load()
+        """
+        lines = Spreadsheet.readLines(filePath, chunkSize)
+
+        for header in lines:
+            if not skipHeader:
+                yield header.split(delimiter)
+
+            if where is not None:
+                keep = Spreadsheet.lineFilter(where, header, delimiter)
+
+                # Test each line before splitting it
+                for line in lines:
+                    if keep(line):
+                        yield line.split(delimiter)
+
+            else:
+                for line in lines:
+                    yield line.split(delimiter)
+
+    @staticmethod
+    def iterQuotedRows(filePath, delimiter="\t", skipHeader=False,
+                       where=None, chunkSize=None):
+        """
+            Yield the rows of a file, parsing quoted cells with the C csv
+            reader. Cells quoted with '"' may hold the delimiter, line
+            breaks and doubled quotes (""). The file is streamed; a row
+            spanning several lines is read as one row. Lines without a
+            quote are split as in iterRows(), so unquoted files load as
+            fast as they do without quoted.
+
+            Attributes:
+                filePath (str): spreadsheet file to read
+                delimiter (str): delimiter of document at filePath
+                skipHeader (bool): do not yield the first (header) row
+                where (function, dict): filter for data rows, see
+                                        rowFilter(). The header row is
+                                        always kept.
+                chunkSize (int): number of characters to read at a time
+
+            Returns:
+                generator: rows as lists, in the same form as load()
+        """
+        # Read the bytes as they are, so "\r" in quoted cells is kept
+        blocks = Spreadsheet.readBlocks(filePath, chunkSize, 'rb')
+
+        # Lines left in the current block, and the text of the block
+        current = [iter(()), ""]
+        pending = list()
+
+        def feed():
+            # A line holding a quote is put in pending for the reader. If a
+            # quoted cell goes on past it, the reader takes the following
+            # lines of the file from here, moving on to the next block if
+            # it must.
+            while True:
+                if pending:
+                    yield pending.pop() + "\n"
+                    continue
+
+                for line in current[0]:
+                    break
+                else:
+                    lines, text = next(blocks)
+                    current[:] = [iter(lines), text]
+                    continue
+
+                yield line + "\n"
+
+        reader = csv.reader(feed(), delimiter=delimiter)
+        header = next(reader, None)
+
+        if header is None:
+            return
+
+        # A blank line is read as one blank cell, as in iterRows()
+        header = header or [""]
+        keep = None
+
+        if not skipHeader:
+            yield header
+
+        if where is not None:
+            keep = Spreadsheet.rowFilter(where, header, delimiter)
+
+        while True:
+            lines, text = current
+
+            # Blocks without a quote or "\r" are split line by line, as in
+            # iterSplitRows()
+            if '"' not in text and "\r" not in text:
+                if keep is None:
+                    for line in lines:
+                        yield line.split(delimiter)
+                else:
+                    for line in lines:
+                        row = line.split(delimiter)
+
+                        if keep(row):
+                            yield row
+
+            else:
+                for line in lines:
+                    if '"' in line:
+                        pending.append(line)
+                        row = next(reader)
+                    elif line.endswith("\r"):
+                        row = line[:-1].split(delimiter)
+                    else:
+                        row = line.split(delimiter)
+
+                    if keep is None or keep(row):
+                        yield row
+
+            # The reader may have moved on to the next block; if not, read it
+            if current[0] is lines:
+                block = next(blocks, None)
+
+                if block is None:
+                    return
+
+                current[:] = [iter(block[0]), block[1]]
+
+    @staticmethod
+    def whereColumns(where, headers):
+        """
+            Get the column tests of a where dict
+
+            Attributes:
+                where (dict): column name or index --> value(s) to keep
+                headers (list): column names
+
+            Returns:
+                list: (column index, frozenset of values) tuples
+
+            Raises:
+                ValueError: if a column name is not in headers
+        """
+        tests = list()
+
+        for column, value in where.items():
+
+            if not isinstance(column, int):
+                if column not in headers:
+                    raise ValueError("'{0}' is not a column in this "
+                                     "spreadsheet".format(column))
+                column = headers.index(column)
+
+            if not isinstance(value, (set, frozenset, list, tuple)):
+                value = (value,)
+
+            tests.append((column, frozenset(value)))
+
+        return tests
+
+    @staticmethod
+    def rowFilter(where, headers, delimiter="\t"):
+        """
+            Get a function that tells if a parsed row passes a filter
+
+            Attributes:
+                where (function): takes the row's cells joined by delimiter
+                                  and returns True to keep it
+                where (dict): column name or index --> value(s) to keep, see
+                              lineFilter()
+                headers (list): column names
+                delimiter (str): delimiter to join cells with for where
+
+            Returns:
+                function: takes a row and returns True to keep it
+
+            Raises:
+                ValueError: if a column name is not in headers
+        """
+        if callable(where):
+            return lambda row: where(delimiter.join(row))
+
+        tests = Spreadsheet.whereColumns(where, headers)
+
+        def keep(row):
+            count = len(row)
+
+            for column, values in tests:
+                if (row[column] if column < count else "") not in values:
+                    return False
+
+            return True
+
+        return keep
+
+    @staticmethod
+    def lineFilter(where, header, delimiter="\t"):
+        """
+            Get a function that tells if a raw line of a file passes a filter
+
+            Attributes:
+                where (function): takes a line of text, without its line
+                                  ending, and returns True to keep it
+                where (dict): column name or index --> value to keep. A set,
+                              list or tuple keeps any of its values. A line
+                              passes if every column matches. Lines are split
+                              only as far as the last column tested.
+                header (str): first line of the file, for column names
+                delimiter (str): delimiter of the file
+
+            Returns:
+                function: takes a line of text and returns True to keep it
+
+            Raises:
+                ValueError: if a column name is not in header
+        """
+        if callable(where):
+            return where
+
+        tests = Spreadsheet.whereColumns(where, header.split(delimiter))
+        last = max([column for column, values in tests] or [0])
+
+        def keep(line):
+            cells = line.split(delimiter, last + 1)
+            count = len(cells)
+
+            for column, values in tests:
+                if (cells[column] if column < count else "") not in values:
+                    return False
+
+            return True
+
+        return keep
+
+    @staticmethod
+    def splitRanges(filePath, count):
+        """
+            Split a file into byte ranges that start and end at newlines
+
+            Attributes:
+                filePath (str): file to split
+                count (int): number of ranges wanted. Ranges are at least
+                             CHUNK_SIZE bytes, so small files get fewer.
+
+            Returns:
+                tuple: (end of the header line, list of (start, end) byte
+                       offsets of the ranges after the header)
+        """
+        size = os.path.getsize(filePath)
+        ranges = list()
+
+        with open(filePath, 'rb') as fileIn:
+            fileIn.readline()
+            headerEnd = start = fileIn.tell()
+            step = max((size - start) // max(count, 1),
+                       Spreadsheet.CHUNK_SIZE)
+
+            while start < size:
+                fileIn.seek(min(start + step, size))
+
+                # Move the end of the range to the end of its last line
+                fileIn.readline()
+                end = min(fileIn.tell(), size)
+
+                ranges.append((start, end))
+                start = end
+
+        return headerEnd, ranges
+
+    @staticmethod
+    def readLines(filePath, chunkSize=None):
+        """
+            Yield the lines of a file without their line endings, reading
+            chunkSize characters at a time
+
+            Attributes:
+                filePath (str): file to read
+                chunkSize (int): number of characters to read at a time
+
+            Returns:
+                generator: lines of text
+        """
+        for lines, text in Spreadsheet.readBlocks(filePath, chunkSize):
+            for line in lines:
+                yield line
+
+    @staticmethod
+    def readBlocks(filePath, chunkSize=None, mode='rU'):
+        """
+            Yield the lines of a file in blocks, reading chunkSize characters
+            at a time
+
+            Attributes:
+                filePath (str): file to read
+                chunkSize (int): number of characters to read at a time
+                mode (str): mode to open filePath in. With 'rb', lines are
+                            split at "\n" only and keep any "\r" before it.
+
+            Returns:
+                generator: (lines, text) tuples: the complete lines read,
+                           without their line endings, and the text they
+                           were split from, so a block can be searched
+                           with one call
+        """
+        if chunkSize is None:
+            chunkSize = Spreadsheet.CHUNK_SIZE
+
+        with open(filePath, mode) as fileIn:
+            remainder = ""
+
+            while True:
+                chunk = fileIn.read(chunkSize)
+
+                if not chunk:
+                    break
+
+                text = remainder + chunk
+                lines = text.split("\n")
+
+                # The last line may continue in the next chunk
+                remainder = lines.pop()
+
+                yield lines, text
+
+            if remainder:
+                yield [remainder], remainder
+
+    def load(self, filePath=None, delimiter="\t", typed=False, where=None,
+             cache=False, workers=None, quoted=False):
         """
             Open the file and parse out rows and columns
 
             Attributes:
                 filePath (str): spreadsheet file to load into memory
                 delimiter (str): delimiter of document at filePath
+                typed (bool): convert numeric columns on load if True
+                where (function, dict): keep only the rows passing this
+                                        filter, see lineFilter(). Other rows
+                                        are never split or stored.
+                cache (bool, str): read the columns from a cache file if it
+                                   is fresh, else parse filePath and write
+                                   the cache. True uses filePath plus
+                                   ColumnCache.SUFFIX; a string is used as
+                                   the cache path. Ignored if where is set.
+                workers (int): number of processes to parse the file with.
+                               Rows come out in the same order as parsing
+                               in this process. A where function must be
+                               picklable, i.e., defined at module level.
+                               Ignored if quoted is True, since a quoted
+                               cell may span a range boundary.
+                quoted (bool): parse quoted cells with the csv module, see
+                               iterQuotedRows()
 
             Raises:
                 ValueError: if filePath is not specified
@@ -749,19 +1919,110 @@ class Spreadsheet(object):
             raise ValueError("Please enter a file path for this method's" +
                              " filePath parameter")
 
-        openedFilePath = self.open(filePath).splitlines()
+        # Drop the placeholder header a blank Spreadsheet() starts with, so
+        # the file's rows are the only data and can be cached
+        if not self.initialized and self.store.columns == [["columnName"]]:
+            self.store.setColumns([])
+
+        columns = None
+        empty = self.store.columnCount() == 0
+
+        if cache and where is None:
+            if cache is True:
+                cache = ColumnCache.path(filePath)
 
-        for line in openedFilePath:
-            self.spreadsheet.append(line.split(delimiter))
+            columns = ColumnCache.read(cache, filePath, delimiter, quoted)
+        else:
+            cache = None
+
+        if columns is not None:
+            if empty:
+                self.store.setColumns(columns)
+            else:
+                self.store.appendRows(izip_longest(*columns, fillvalue=""))
+
+        else:
+            if workers is not None and workers > 1 and not quoted:
+                self.loadParallel(filePath, delimiter, where, workers)
+            else:
+                self.store.appendRows(self.iterRows(filePath, delimiter,
+                                                    where=where,
+                                                    quoted=quoted))
+
+            # Only cache the columns if they all came from filePath
+            if cache and empty:
+                ColumnCache.write(cache, filePath, delimiter,
+                                  self.store.columns, quoted)
 
         self.filePath = filePath
         self.loaded = True
+        self.headerIndex = None
         self.toRows()
+        self.initialized = True
+        self.numericColumns = dict()
+        self.indexes = dict()
 
-        if not self.initialized and self.spreadsheet[0] == "columnName":
-            del(self.spreadsheet[0])
+        if typed:
+            self.inferTypes()
 
-        self.initialized = True
+    def loadParallel(self, filePath, delimiter="\t", where=None, workers=2):
+        """
+            Parse a file in a pool of worker processes and append its rows
+            to the store. The file is split into byte ranges at newlines;
+            each range is parsed by a worker, and the results are appended
+            in file order as they arrive.
+
+            Attributes:
+                filePath (str): spreadsheet file to load into memory
+                delimiter (str): delimiter of document at filePath
+                where (function, dict): keep only the rows passing this
+                                        filter, see lineFilter()
+                workers (int): number of processes
+
+            Raises:
+                PicklingError: if where cannot be sent to the workers. The
+                               store is left as it was before the call, as
+                               it is on any other error while parsing.
+        """
+        headerEnd, ranges = self.splitRanges(filePath, workers * 4)
+
+        with open(filePath, 'rb') as fileIn:
+            header = fileIn.read(headerEnd)
+
+        header = header.rstrip("\n").rstrip("\r")
+
+        store = self.store
+        width = store.columnCount()
+        count = store.rowCount()
+
+        try:
+            if headerEnd > 0:
+                store.appendRows([header.split(delimiter)])
+
+            if not ranges:
+                return
+
+            tasks = [(filePath, start, end, delimiter, header, where)
+                     for start, end in ranges]
+
+            pool = multiprocessing.Pool(min(workers, len(tasks)))
+
+            try:
+                for columns in pool.imap(parseRange, tasks):
+                    store.appendColumns(columns)
+            finally:
+                pool.terminate()
+                pool.join()
+
+        except:
+            # Remove the rows and columns added so far
+            store.version += 1
+            del store.columns[width:]
+
+            for column in store.columns:
+                del column[count:]
+
+            raise
 
     def newColumn(self, name=" ", fillWith=" "):
         """
@@ -780,8 +2041,45 @@ class Spreadsheet(object):
         newColumn[0] = name
 
         self.spreadsheet.append(newColumn)
+        self.headerIndex = None
         self.refresh()
 
+    def numeric(self, column):
+        """
+            Get a column's values as numbers
+
+            Attributes:
+                column (str, int): index or name of column
+
+            Returns:
+                NumericColumn: values of the column without the header
+
+            Raises:
+                ValueError: if a non-blank cell in the column is not a number
+        """
+        index = self.getColumnIndex(column)
+        # Edits pad only the columns they touch, so pad this one to full size
+        cells = self.store.padColumn(index, self.store.rowCount())
+        version = self.store.version
+        cached = self.numericColumns.get(index)
+
+        # Reuse the conversion if the column has not changed since
+        if (cached is not None and cached[0] is cells and
+                cached[1] == len(cells) and cached[2] == version):
+            numeric = cached[3]
+        else:
+            try:
+                numeric = NumericColumn(cells[1:])
+            except(ValueError):
+                numeric = None
+
+            self.numericColumns[index] = (cells, len(cells), version, numeric)
+
+        if numeric is None:
+            raise ValueError("Column '{0}' is not numeric".format(cells[0]))
+
+        return numeric
+
     def open(self, filePath):
         """Opens an indicated text file for processing
             @param  filePath: path of file to load
@@ -803,32 +2101,99 @@ class Spreadsheet(object):
             Returns:
                 str: String of spreadsheet in normal form (e.g. not transposed)
         """
+        savedata = "\n".join(self.iterLines(spreadsheet, delimiter))
+
+        return savedata
+
+    def iterLines(self, spreadsheet=None, delimiter="\t", columns=None,
+                  quoted=False):
+        """
+            Yields rows formatted as lines of text for saving
+
+            Attributes:
+                spreadsheet (iterable): rows to format. This instance's
+                                        spreadsheet is used if None.
+                delimiter (str): delimiter to separate cells with
+                columns (list): names or indices of the columns to keep.
+                                Names are looked up in the first row.
+                quoted (bool): quote cells holding the delimiter, '"' or a
+                               line break with the csv module, so the lines
+                               can be read back with load(quoted=True)
+
+            Returns:
+                generator: one string per row, without a line ending
+        """
         # Use this instance's spreadsheet if none specified
         if spreadsheet is None:
             self.toRows()
-            spreadsheet = self.spreadsheet
+            data = self.store.columns
 
-        rowList = list()
-        append = rowList.append
+            if columns is not None:
+                data = [data[self.getColumnIndex(column)]
+                        for column in columns]
 
-        for row in spreadsheet:
-            row = [str(item) for item in row]
-            append(delimiter.join(row))
+            spreadsheet = izip_longest(*data, fillvalue="")
 
-        savedata = "\n".join(rowList)
+        elif columns is not None:
+            spreadsheet = iter(spreadsheet)
+            first = next(spreadsheet, None)
 
-        return savedata
+            if first is None:
+                return
+
+            first = list(first)
+            indices = [column if isinstance(column, int)
+                       else first.index(column) for column in columns]
+
+            # Put the first row back in front of the remaining rows
+            spreadsheet = ([row[i] if i < len(row) else "" for i in indices]
+                           for row in chain([first], spreadsheet))
+
+        if quoted:
+            # Write each row to a buffer and take it back as a line, without
+            # the line terminator. Both "\r" and "\n" are in the terminator,
+            # so cells holding either are quoted.
+            out = StringIO()
+            writerow = csv.writer(out, delimiter=delimiter,
+                                  lineterminator="\r\n").writerow
+
+            for row in spreadsheet:
+                writerow([str(item) for item in row])
+                yield out.getvalue()[:-2]
+                out.seek(0)
+                out.truncate()
+
+            return
+
+        join = delimiter.join
+
+        for row in spreadsheet:
+            yield join([str(item) for item in row])
 
     def refresh(self):
         """
-            Make sure all columns/rows are the same length
+            Make sure all columns/rows are the same length. Inside batch() the
+            refresh is put off until the batch ends.
         """
-        self.transpose()
-        self.transpose()
+        if self.batchDepth:
+            self.refreshPending = True
+            return
+
+        self.store.normalize()
 
         if len(self) > 0:
             self.initialized = True
 
+    def records(self):
+        """
+            Yield each row of this spreadsheet, header first, as a tuple.
+            Short columns are read as blank cells.
+
+            Returns:
+                generator: rows as tuples
+        """
+        return izip_longest(*self.store.columns, fillvalue="")
+
     def rename(self, name=None, index=-1):
         """
             Rename a specified column
@@ -840,6 +2205,7 @@ class Spreadsheet(object):
         # Transpose spreadsheet to edit column
         self.toColumns()
         self.spreadsheet[index][0] = name
+        self.headerIndex = None
 
     def removeColumn(self, column=-1):
         """
@@ -856,6 +2222,7 @@ class Spreadsheet(object):
             column = self.getColumnIndex(column)
 
         del self.spreadsheet[column]
+        self.headerIndex = None
 
     @preserve_transpose
     def removeRow(self, row=-1):
@@ -869,6 +2236,7 @@ class Spreadsheet(object):
         self.toRows()
 
         del self.spreadsheet[row]
+        self.headerIndex = None
         self.revertTranspose(state)
 
     def reset(self):
@@ -876,7 +2244,10 @@ class Spreadsheet(object):
             Reset all data in this class
         """
 
-        self.spreadsheet = list()  # list containing spreadsheet
+        self.store = ColumnStore()  # columnar storage for spreadsheet
+        self.headerIndex = None  # column name --> column index
+        self.numericColumns = dict()  # column index --> NumericColumn
+        self.indexes = dict()  # (column index, ordered) --> column index
 
         self.filePath = None  # location of the spreadsheet
         self.savePath = None  # location of the spreadsheet
@@ -916,34 +2287,68 @@ class Spreadsheet(object):
                                  " Spreadsheet.row(rowAsList)")
 
             # Transpose spreadsheet to edit row
+            version = self.store.version
             self.spreadsheet.append(row)
+            self.indexRow(version, len(self.spreadsheet) - 1)
             self.refresh()
 
         self.revertTranspose(state)
 
     def save(self, savePath=None, savedata=None,
-             saveType='w', delimiter="\t"):
+             saveType='w', delimiter="\t", columns=None, header=True,
+             quoted=False):
         """
-        Writes data out to a file
+        Writes data out to a file. Rows are written in batches of SAVE_BATCH
+        rows, so memory use does not grow with the size of the output.
 
         Args:
             savePath (str): name of the file to be saved
-            savedata (str): list of rows/columns to be saved
+            savedata (list): list (or generator, e.g., sortFile()) of
+                             rows/columns to be saved
             saveType (str): indicate overwrite ('w') or append ('a')
             delimiter (str): type of delimiter to use for output
+            columns (list): names or indices of the columns to write. All
+                            columns are written if None.
+            header (bool): write the first row if True. Use False to append
+                           rows to a file that already has a header.
+            quoted (bool): quote cells holding the delimiter, '"' or a line
+                           break, so the file can be reloaded with
+                           load(quoted=True). See iterLines().
         """
 
         if savePath is None:
             savePath = self.savePath
 
-        if savedata is None:
-            savedata = self.prepareForSave(delimiter=delimiter)
-        else:
-            savedata = self.prepareForSave(spreadsheet=savedata,
-                                           delimiter=delimiter)
+        lines = self.iterLines(savedata, delimiter, columns, quoted)
+
+        if not header:
+            next(lines, None)
+
+        # When appending, start on a new line if the file does not end in one
+        separator = ""
+
+        if saveType.startswith('a') and os.path.isfile(savePath):
+            with open(savePath, 'rb') as fin:
+                fin.seek(0, 2)
+
+                if fin.tell() > 0:
+                    fin.seek(-1, 2)
+
+                    if fin.read(1) != "\n":
+                        separator = "\n"
 
         with open(savePath, saveType) as fout:
-            fout.write(savedata)
+            write = fout.write
+
+            while True:
+                batch = list(islice(lines, self.SAVE_BATCH))
+
+                if not batch:
+                    break
+
+                write(separator)
+                write("\n".join(batch))
+                separator = "\n"
 
     def setData(self, data, asRows=True):
         """
@@ -972,10 +2377,12 @@ class Spreadsheet(object):
             append(row)
 
         # Assign this spreadsheet to the new one
-
+        self.transposed = asRows
         self.spreadsheet = spreadsheet
+        self.headerIndex = None
+        self.numericColumns = dict()
+        self.indexes = dict()
         self.initialized = True
-        self.transposed = asRows
 
     def savePath(self, savePath=None):
         """
@@ -989,46 +2396,145 @@ class Spreadsheet(object):
         else:
             self.savePath = savePath
 
-    def sort(self, column=0, reverse=False, hasTitle=True):
+    def sort(self, column=0, reverse=False, hasTitle=True, keys=None):
         """
-            Sorts entire spreadsheet based on column
+            Sorts entire spreadsheet based on column. Numeric columns are
+            sorted as numbers with blank cells last.
 
             Attributes:
                 column (int): column to sort by
                 reverse (bool): reverse sort
                 hasTitle (bool): if True, sort spreadsheet from 2nd row (i==1)
+                keys (list): columns to sort by, in order of priority. Each
+                             is a column or a tuple of (column, reverse,
+                             collation), collation being 'number' or 'text'.
+                             Replaces column and reverse if specified.
         """
+        if keys is None:
+            keys = [(column, reverse)]
 
-        def get_cell(row):
-            """
-                Returns cell value at column index specified
+        keys = [key if isinstance(key, tuple) else (key,) for key in keys]
+        keys = [(self.getColumnIndex(key[0]),) + key[1:] for key in keys]
+        sortKey = SortKey(keys, collate=self.getColumnType)
 
-                Attributes:
-                    row (list): row as a list
-                    column (int): column index from parent method
+        self.toRows()
+        self.store.normalize()
 
-                Returns:
-                    int, str: value of cell at specified column
-            """
-            return row[column]
+        # Build the key for each row once, column by column, then sort row
+        # positions by those keys
+        columns = self.store.columns
+        start = 1 if hasTitle is True else 0
+        cells = [map(key, columns[j][start:])
+                 for key, j in zip(sortKey.keys, sortKey.columns)]
+        cells = cells[0] if len(cells) == 1 else zip(*cells)
+        order = sorted(xrange(len(cells)), key=cells.__getitem__)
 
-        column = self.getColumnIndex(column)
-        self.toRows()
+        # Reorder every column once by the sorted positions. If hasTitle is
+        # True, the header is not included in sorting
+        self.store.columns = [c[:start] + [c[start + i] for i in order]
+                              for c in columns]
 
-        # Define different parts of the spreadsheet for processing
-        spreadsheet = self.spreadsheet
-        spreadsheet_header = [spreadsheet[0]]
-        spreadsheet_body = spreadsheet[1:]
+        if start == 0:
+            self.headerIndex = None
 
-        # If hasTitle is True, the header is not included in sorting
-        if hasTitle is True:
-            body = sorted(spreadsheet_body, key=get_cell, reverse=reverse)
-            self.spreadsheet = spreadsheet_header + body
+    @staticmethod
+    def sortFile(filePath, keys, delimiter="\t", hasTitle=True, runSize=None):
+        """
+            Sorts a file that may be larger than memory. Rows are read in
+            runs of runSize rows; each run is sorted in memory and written to
+            a temporary file, and the runs are merged as rows are requested.
+            Pass the result to save() to write the sorted file.
 
-        # Include header in sorting
-        else:
-            self.spreadsheet = sorted(spreadsheet, key=get_cell,
-                                      reverse=reverse)
+            Attributes:
+                filePath (str): spreadsheet file to sort
+                keys (list): columns to sort by, see sort()
+                delimiter (str): delimiter of document at filePath
+                hasTitle (bool): if True, the first row is kept first
+                runSize (int): number of rows sorted in memory at a time
+
+            Returns:
+                generator: sorted rows as lists
+        """
+        if runSize is None:
+            runSize = Spreadsheet.RUN_SIZE
+
+        rows = Spreadsheet.iterRows(filePath, delimiter)
+        headers = None
+
+        if hasTitle:
+            headers = next(rows, None)
+
+            if headers is None:
+                return
+
+            yield headers
+
+        runs = list()
+        sortKey = None
+
+        try:
+            while True:
+                run = list(islice(rows, runSize))
+
+                if not run:
+                    break
+
+                # Collations of unnamed key columns come from the first run
+                if sortKey is None:
+                    getRunType = Spreadsheet.getRunType
+                    sortKey = SortKey(keys, headers,
+                                      lambda j: getRunType(run, j))
+
+                run.sort(key=sortKey)
+
+                # If everything fits in one run, there is nothing to merge
+                if not runs and len(run) < runSize:
+                    for row in run:
+                        yield row
+                    return
+
+                runFile = tempfile.TemporaryFile()
+                runFile.writelines(delimiter.join(row) + "\n" for row in run)
+                runFile.seek(0)
+                runs.append(runFile)
+
+            def readRun(n, runFile):
+                for i, line in enumerate(runFile):
+                    row = line[:-1].split(delimiter)
+                    yield sortKey(row), n, i, row
+
+            merged = heapq.merge(*[readRun(n, runFile)
+                                   for n, runFile in enumerate(runs)])
+
+            for key, n, i, row in merged:
+                yield row
+
+        finally:
+            for runFile in runs:
+                runFile.close()
+
+    @staticmethod
+    def getRunType(rows, column):
+        """
+            Get the type of the values of a column in a list of rows
+
+            Attributes:
+                rows (list): rows as lists
+                column (int): index of column
+
+            Returns:
+                str: 'number' if all non-blank cells are numbers, else 'text'
+        """
+        try:
+            numeric = NumericColumn([row[column] if column < len(row) else ""
+                                     for row in rows])
+        except(ValueError):
+            return "text"
+
+        if numeric.count() == 0:
+            return "text"
+
+        return "number"
 
     def toColumns(self):
         """
@@ -1056,54 +2562,129 @@ class Spreadsheet(object):
         """
 
         state = self.getState()
-        string = ""
+        lines = list()
 
         if fileToString is None:
             self.toRows()
             fileToString = self.spreadsheet
 
         if self.initialized:
-            join = str.join
+            join = "\t\t".join
+            append = lines.append
 
-            # Loop through the lines to join them as strings
+            # Format each line, then join them all once
             for line in fileToString:
-
-                line = [str(item).rjust(20, ' ') for item in line]
-                string += join("\t\t", line) + "\n"
+                append(join([str(item).rjust(20, ' ') for item in line]))
+                append("\n")
 
         self.revertTranspose(state)
-        return string
+        return "".join(lines)
 
-    def transpose(self):
+    def head(self, rows=None):
         """
-            Transposes this spreadsheet's rows and columns
+            Get the header and the first rows as a formatted string
+
+            Attributes:
+                rows (int): number of rows after the header. PREVIEW_ROWS
+                            if None.
+
+            Returns:
+                str: formatted rows, see render()
         """
-        temp_spreadsheet = list()
+        if rows is None:
+            rows = self.PREVIEW_ROWS
 
-        # CALL THESE JUST ONCE BEFORE LOOP(S)
-        append = temp_spreadsheet.append
-        longest_list = len(max(self.spreadsheet, key=len))
+        return self.render(xrange(min(rows, self.getRowCount()) + 1))
 
-        # Loop through the longest row (transposed=f) or column (transposed=t)
-        for index in xrange(longest_list):
+    def page(self, number=0, size=None):
+        """
+            Get the header and one page of rows as a formatted string
 
-            # At this index, insert a list for the new row/column
-            append(list())
+            Attributes:
+                number (int): index of the page, 0 for the first page
+                size (int): number of rows per page. PAGE_SIZE if None.
 
-            # CALL THESE JUST ONCE BEFORE LOOP(S)
-            append2 = temp_spreadsheet[index].append
+            Returns:
+                str: formatted rows, see render()
+        """
+        if size is None:
+            size = self.PAGE_SIZE
+
+        start = number * size + 1
+        end = min(start + size, self.getRowCount() + 1)
+
+        return self.render([0] + range(start, end))
+
+    def render(self, positions):
+        """
+            Format some rows of this spreadsheet. Only these rows are read,
+            so rendering takes the same time however large the spreadsheet
+            is. Each column is as wide as its widest cell among these rows;
+            cells wider than MAX_WIDTH are cut short with "...".
+
+            Attributes:
+                positions (list): indices of the rows to format
+
+            Returns:
+                str: one line per row
+        """
+        if not self.initialized:
+            return ""
+
+        rows = [[str(cell) for cell in self.row(i)] for i in positions]
+        limit = self.MAX_WIDTH
+
+        for row in rows:
+            for j, cell in enumerate(row):
+                if len(cell) > limit:
+                    row[j] = cell[:limit - 3] + "..."
+
+        # Size columns by the rows shown rather than by the whole spreadsheet
+        widths = list()
+
+        for row in rows:
+            for j, cell in enumerate(row):
+                if j == len(widths):
+                    widths.append(len(cell))
+                elif len(cell) > widths[j]:
+                    widths[j] = len(cell)
+
+        lines = ["  ".join([cell.rjust(width)
+                            for cell, width in zip(row, widths)])
+                 for row in rows]
 
-            # Loop through current spreadsheet to transpose rows<==>columns
-            for line in self.spreadsheet:
-                try:
-                    append2(line[index])
-                except(IndexError):
+        return "\n".join(lines) + "\n"
 
-                    # If the specified cell does not exist, i.e., blank
-                    append2("")
+    def tail(self, rows=None):
+        """
+            Get the header and the last rows as a formatted string
+
+            Attributes:
+                rows (int): number of rows after the header. PREVIEW_ROWS
+                            if None.
+
+            Returns:
+                str: formatted rows, see render()
+        """
+        if rows is None:
+            rows = self.PREVIEW_ROWS
+
+        count = self.getRowCount()
+        start = max(count - rows + 1, 1)
+
+        return self.render([0] + range(start, count + 1))
 
-        self.spreadsheet = temp_spreadsheet
+    def transpose(self):
+        """
+            Transposes this spreadsheet's rows and columns
+
+            Returns:
+                RowsView or ColumnsView: view of self.store in the new
+                orientation. Missing cells are padded when read.
+        """
+        # Data stays in self.store; only the orientation of the view changes
         self.transposed = not self.getState()
+        return self.spreadsheet
 
     def revertTranspose(self, prior_state):
         """
@@ -8,6 +8,9 @@
 
 class Cell(object):
 
+	# No per-instance __dict__; a sheet may hold millions of cells
+	__slots__ = ('value', 'value_type')
+
 	def __init__(self, value=None):
 		self.value = None
 		self.value_type = None
@@ -53,6 +56,15 @@ class Cell(object):
 		""" return the value of this cell """
 		return self.value
 
+	@staticmethod
+	def raw(value):
+		""" return the value inside a Cell, or value itself if it is not a Cell
+			@param	value: Cell or raw value
+		"""
+		if isinstance(value, Cell):
+			return value.value
+		return value
+
 	def set(self, value=None):
 		""" set the cells value and type 
 			@param	value: value to set Cell to
@@ -64,6 +76,31 @@ class Cell(object):
 		""" return the type of this cell's value """
 		return self.value_type
 
+class BoundCell(Cell):
+	""" A Cell read from a Column or RowView, which keep raw values rather
+		than Cell objects. set() also writes the value back to the parent.
+	"""
+
+	__slots__ = ('parent', 'index')
+
+	def __init__(self, parent, index, value=None):
+		""" Initialize an instance of this class
+			@param	parent: Column or RowView holding the cell
+			@param	index: position of the cell in parent
+			@param	value: raw value of the cell
+		"""
+		self.parent = parent
+		self.index = index
+		self.value = value
+		self.value_type = None if value is None else type(value)
+
+	def set(self, value=None):
+		""" set the cells value and type, and the parent's cell
+			@param	value: value to set Cell to
+		"""
+		Cell.set(self, value)
+		self.parent.set(self.index, value)
+
 if __name__=="__main__":
 	c = Cell()
 	c.set("toasty things are delicious")
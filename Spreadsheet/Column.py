@@ -5,26 +5,116 @@
 # Version:  1.0.0
 # Author:   Glenn Abastillas
 # Date:     August 25, 2016
-
-from Cell import Cell
+#
+# Updates:
+# 1. [2026/10/18] cells are stored as raw values, in an array.array if a
+#                 typecode is given, and wrapped in a Cell only when read.
+# 2. [2026/10/18] resize() pads or truncates the column in one step.
+# 3. [2026/10/18] slices are SliceView objects over the column, not copies.
+# 4. [2026/10/18] whole-column +, -, *, / and lower, strip, replace, contains.
+#                 Numeric arrays are computed with NumPy if it is installed.
+# 5. [2026/10/18] cells are read as BoundCell objects, so set() on a cell
+#                 from c[i], c.get(i) or a for loop changes the column.
+# 6. [2026/10/18] NumPy arithmetic that would divide by zero or overflow is
+#                 computed in a list instead, as it is without NumPy.
+
+from array import array
+from itertools import izip, repeat
+import operator
+
+try:
+	import numpy
+except(ImportError):
+	numpy = None
+
+from Cell import BoundCell, Cell
+from SliceView import SliceView
+
+NAN = float("nan")
+
+# array.array typecodes of numbers
+NUMBERS = "bBhHiIlLfd"
+
+def subtract(a, b):
+	""" return a - b, or a without any b for strings, as Cell does """
+	if isinstance(a, basestring):
+		return a.replace(b, "")
+	return a - b
+
+def divide(a, b):
+	""" return a / b, or a without the characters of b for strings, as Cell does """
+	if isinstance(a, basestring):
+		return "".join([character for character in a if character not in b])
+	return a / b
+
+def overflows(a, b, function, reflected, dtype):
+	""" return True if function of a and b, computed in floats, falls outside
+		the integers of dtype, i.e., NumPy wrapped the integer result
+		@param	a: numpy array of integers
+		@param	b: numpy array or number
+		@param	function: function of two values
+		@param	reflected: True to pass b as the first argument
+		@param	dtype: integer dtype of the NumPy result
+	"""
+	a = a.astype(float)
+	b = b.astype(float) if isinstance(b, numpy.ndarray) else float(b)
+	exact = function(b, a) if reflected else function(a, b)
+	limits = numpy.iinfo(dtype)
+	return bool(numpy.any((exact < float(limits.min)) | (exact >= float(limits.max) + 1)))
 
 class Column(object):
+
+	__slots__ = ('index', 'sep', 'column_name', 'column_index', 'column')
 	
-	def __init__(self, name="column", size=1, default="", column_index=0, sep="\n"):
+	def __init__(self, name="column", size=1, default="", column_index=0, sep="\n", typecode=None, values=None):
+		""" Initialize an instance of this class
+			@param	name: name of column
+			@param	size: number of cells
+			@param	default: value of each cell
+			@param	column_index: position of column in the spreadsheet
+			@param	sep: separator used by toString()
+			@param	typecode: array.array typecode (e.g., 'd' or 'l') to store
+					numbers compactly. Cells are kept in a list if None, or if
+					a value does not fit the typecode
+			@param	values: raw values to build the column from, in place of
+					size and default
+		"""
 		self.index = 0
 		self.sep = sep
 		self.column_name = name
 
 		self.column_index = column_index
-		self.column = [Cell(default) for i in xrange(size)]
+
+		if values is not None:
+			self.column = list(values)
+		else:
+			self.column = [Cell.raw(default)] * size
+
+		if typecode is not None:
+			self.pack(typecode)
+
+	def __add__(self, other):
+		""" return a new column of sums, or concatenated strings
+			@param	other: Column of the same length, or a value
+		"""
+		return self.operate(other, operator.add)
+
+	def __div__(self, other):
+		""" return a new column of quotients, or strings without the
+			characters of other
+			@param	other: Column of the same length, or a value
+		"""
+		return self.operate(other, divide)
 
 	def __getitem__(self, i):
-		""" return item at specified index """
-		return self.column[i]
+		""" return item at specified index, or a view of a slice """
+		if isinstance(i, slice):
+			return SliceView(self, i)
+		return self.get(i)
 
 	def __getslice__(self, i, j):
-		""" return entries at specified span """
-		return self.column[i:j]
+		""" return a view of the specified span """
+		return SliceView(self, slice(i, j))
 
 	def __iter__(self):
 		"""	allow for iteration over this object
@@ -36,17 +126,47 @@ class Column(object):
 		""" return row length """
 		return len(self.column)
 
+	def __mul__(self, other):
+		""" return a new column of products, or repeated strings
+			@param	other: Column of the same length, or a value
+		"""
+		return self.operate(other, operator.mul)
+
+	def __radd__(self, other):
+		return self.operate(other, operator.add, True)
+
+	def __rdiv__(self, other):
+		return self.operate(other, divide, True)
+
+	def __rmul__(self, other):
+		return self.operate(other, operator.mul, True)
+
+	def __rsub__(self, other):
+		return self.operate(other, subtract, True)
+
 	def __setitem__(self, i, value):
 		""" set value of specified cell """
-		self.column[i] = Cell(value)
+		self.set(i, value)
 
 	def __setslice__(self, i, j, value):
 		""" set value of specified cells """
-		self.column[i:j] = [Cell(entry) for entry in value]
+		values = [Cell.raw(entry) for entry in value]
+
+		try:
+			self.column[i:j] = type(self.column)(*self.storage(values))
+		except(TypeError, OverflowError):
+			self.unpack()
+			self.column[i:j] = values
 
 	def __str__(self):
 		""" return string representation of row """
-		return self.sep.join([self.column_name]+[str(c) for c in self.column])
+		return self.sep.join([self.column_name]+[str(value) for value in self.column])
+
+	def __sub__(self, other):
+		""" return a new column of differences, or strings without other
+			@param	other: Column of the same length, or a value
+		"""
+		return self.operate(other, subtract)
 
 	def next(self):
 		""" returns the next object when object is iterated against
@@ -54,7 +174,7 @@ class Column(object):
 		"""
 		try:
 			self.index += 1
-			return self.column[self.index-1]
+			return BoundCell(self, self.index-1, self.column[self.index-1])
 		except(IndexError, KeyError):
 			self.index = 0
 			raise StopIteration
@@ -63,20 +183,39 @@ class Column(object):
 		""" append a new value to this row 
 			@param	value: value to add to row
 		"""
-		self.column.append(Cell(value))
+		value = Cell.raw(value)
+
+		try:
+			self.column.append(value)
+		except(TypeError, OverflowError):
+			self.unpack()
+			self.column.append(value)
 
 	def clear(self):
 		""" reset specified cell 
 			@param	index: index of specified cell
 		"""
-		for cell in self.column:
-			cell.set("")
+		self.column = [""] * len(self.column)
 
 	def clear_cell(self, index, default=""):
 		""" reset specified cell 
 			@param	index: index of specified cell
 		"""
-		self.column[index] = Cell(default)
+		self.set(index, default)
+
+	def contains(self, text):
+		""" return a new column, True where the cell is a string holding text
+			@param	text: substring to look for
+		"""
+		return self.derive([isinstance(value, basestring) and text in value for value in self.column])
+
+	def derive(self, values):
+		""" return a new column like this one holding values
+			@param	values: list or array of raw values, used without copying
+		"""
+		column = Column(self.column_name, 0, column_index=self.column_index, sep=self.sep)
+		column.column = values
+		return column
 
 	def delete(self, index):
 		""" remove the specified cell from self.column
@@ -88,14 +227,24 @@ class Column(object):
 		""" set all cells to fill value
 			@param	value: value to set cells to
 		"""
-		for cell in self.column:
-			cell.set(value)
+		value = Cell.raw(value)
+
+		try:
+			self.column = type(self.column)(*self.storage([value] * len(self.column)))
+		except(TypeError, OverflowError):
+			self.column = [value] * len(self.column)
 
 	def get(self, index):
-		""" return cell object at index 
+		""" return cell object at index. Setting the cell sets this column's
+			cell too.
 			@param	index: position of cell to return
 		"""
-		return self.column[index]
+		value = self.column[index]
+
+		if index < 0:
+			index += len(self.column)
+
+		return BoundCell(self, index, value)
 
 	def get_cells(self, indices):
 		""" return a list of cells indicated by indices
@@ -111,34 +260,154 @@ class Column(object):
 		""" return column_name attribute """
 		return self.column_name
 
-	def set(self, index, value):
-		""" set cell value at specified index """
-		self.column[index].set(value)
+	def get_value(self, index):
+		""" return raw value at index, without wrapping it in a Cell
+			@param	index: position of value to return
+		"""
+		return self.column[index]
 
-	def set_column(self, row):
-		""" set self.row attribute to new list of cells 
-			@param	row: list of Cell objects
+	def get_values(self):
+		""" return the list or array holding this column's raw values """
+		return self.column
+
+	def lower(self):
+		""" return a new column with string cells in lower case """
+		return self.derive([value.lower() if isinstance(value, basestring) else value for value in self.column])
+
+	def operate(self, other, function, reflected=False):
+		""" return a new column of function applied to each cell and the
+			matching cell of other, or other itself if it is a value. A
+			column stored in an array, with an array or a number as other,
+			is computed in one NumPy operation if NumPy is installed.
+			Other cells, and NumPy operations that would divide by zero,
+			overflow or wrap an integer, are computed in a list
+			comprehension, so the result does not depend on NumPy.
+			@param	other: Column of the same length, or a value
+			@param	function: function of two values
+			@param	reflected: True to pass other as the first argument
 		"""
-		all_cell_objects = sum(type(entry)!=type(Cell()) for entry in row)
-		#print row
+		values = self.column
 
-		if all_cell_objects == 0:
-			self.row = row
+		if isinstance(other, Column):
+			if len(other) != len(self):
+				raise ValueError("Columns have different lengths: {} and {}".format(len(self), len(other)))
+			other = other.column
+			scalar = False
 		else:
+			other = Cell.raw(other)
+			scalar = True
+
+		numeric = isinstance(values, array) and values.typecode in NUMBERS
+		numeric = numeric and (isinstance(other, (int, long, float)) or isinstance(other, array) and other.typecode in NUMBERS)
+
+		if numeric and numpy is not None and len(values) > 0:
+			a = numpy.frombuffer(values, dtype=values.typecode)
+			b = other if scalar else numpy.frombuffer(other, dtype=other.typecode)
 
-			new_column = list()
-			append = new_column.append
+			try:
+				with numpy.errstate(all='raise'):
+					result = function(b, a) if reflected else function(a, b)
+			except(FloatingPointError, OverflowError, ZeroDivisionError):
+				result = None
 
-			for entry in row:
+			if result is not None and result.dtype.kind in "iu" and overflows(a, b, function, reflected, result.dtype):
+				result = None
 
-				if type(entry)!=type(Cell()):
-					append(Cell(entry))
-				else:
-					append(entry)
+			if result is not None and result.dtype.char in NUMBERS:
+				packed = array(result.dtype.char)
+				packed.fromstring(result.tostring())
+				return self.derive(packed)
 
-			self.row = new_column
+			if result is not None:
+				return self.derive(result.tolist())
 
-			#print new_column
+		if scalar:
+			other = repeat(other, len(values))
+
+		if reflected:
+			result = self.derive([function(b, a) for a, b in izip(values, other)])
+		else:
+			result = self.derive([function(a, b) for a, b in izip(values, other)])
+
+		if numeric:
+			result.pack(values.typecode) or result.pack('d')
+
+		return result
+
+	def resize(self, size, default=""):
+		""" pad the column with default, or truncate it, to size cells. New
+			cells are added with one extend of the list or array, which
+			grows its capacity geometrically, so repeated resizes are
+			amortized O(1) per cell.
+			@param	size: new number of cells
+			@param	default: value of added cells
+		"""
+		difference = size-len(self.column)
+
+		if difference < 0:
+			del self.column[size:]
+		elif difference > 0:
+			default = Cell.raw(default)
+
+			try:
+				self.column.extend(type(self.column)(*self.storage([default])) * difference)
+			except(TypeError, OverflowError):
+				self.unpack()
+				self.column.extend([default] * difference)
+
+	def pack(self, typecode='d'):
+		""" store cells in an array.array of typecode if every value fits
+			@param	typecode: array.array typecode, e.g., 'd' or 'l'
+			@return	True if the column is now stored in an array
+		"""
+		try:
+			self.column = array(typecode, self.column)
+			return True
+		except(TypeError, OverflowError):
+			return False
+
+	def replace(self, old, new):
+		""" return a new column with old replaced by new in string cells
+			@param	old: substring to replace
+			@param	new: replacement
+		"""
+		return self.derive([value.replace(old, new) if isinstance(value, basestring) else value for value in self.column])
+
+	def set(self, index, value):
+		""" set cell value at specified index """
+		value = Cell.raw(value)
+
+		try:
+			self.column[index] = value
+		except(TypeError, OverflowError):
+			self.unpack()
+			self.column[index] = value
+
+	def set_column(self, row):
+		""" set self.column attribute to new list of cells 
+			@param	row: list of Cell objects or raw values
+		"""
+		self.column = [Cell.raw(entry) for entry in row]
+
+	def storage(self, values):
+		""" return arguments to rebuild this column's storage type with values
+			@param	values: list of raw values
+		"""
+		if isinstance(self.column, array):
+			return (self.column.typecode, values)
+		return (values,)
+
+	def strip(self, characters=None):
+		""" return a new column with leading and trailing characters removed
+			from string cells
+			@param	characters: characters to remove; whitespace if None
+		"""
+		return self.derive([value.strip(characters) if isinstance(value, basestring) else value for value in self.column])
+
+	def unpack(self):
+		""" store cells in a list so that they can hold any value """
+		if isinstance(self.column, array):
+			self.column = self.column.tolist()
 
 	def set_column_index(self, index):
 		""" set column_index attribute 
@@ -156,11 +425,23 @@ class Column(object):
 		""" add cells to the column if size is greater than current size 
 			@param	size: new size to set column to
 		"""
-		number_of_cells_to_add = size-len(self)
-		append = self.column.append
+		if size > len(self):
+			self.resize(size, None)
+
+	def to_numbers(self, blank=NAN):
+		""" return a new column of the cells as floats in an array('d'), so
+			that arithmetic on it is vectorized
+			@param	blank: value of blank cells
+			@raise	ValueError: if a non-blank cell is not a number
+		"""
+		values = [blank if value == "" else value for value in self.column]
+
+		if numpy is not None:
+			packed = array('d')
+			packed.fromstring(numpy.array(values, dtype=float).tostring())
+			return self.derive(packed)
 
-		for cell in range(number_of_cells_to_add):
-			append(Cell())
+		return self.derive(array('d', [float(value) for value in values]))
 
 	def toString(self, sep="\n"):
 		""" return string representation of row """
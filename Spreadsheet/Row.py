@@ -7,8 +7,11 @@
 # Date:     August 25, 2016
 
 from Cell import Cell
+from SliceView import SliceView
 
 class Row(object):
+
+	__slots__ = ('index', 'sep', 'row_index', 'row')
 	
 	def __init__(self, size=1, default="", row_index=0, sep="\t"):
 		self.index = 0
@@ -18,13 +21,15 @@ class Row(object):
 		self.row = [Cell(default) for i in xrange(size)]
 
 	def __getitem__(self, i):
-		""" return item at specified index """
+		""" return item at specified index, or a view of a slice """
 		#print "GETTING", i, self.row[i]
+		if isinstance(i, slice):
+			return SliceView(self, i)
 		return self.row[i]
 
 	def __getslice__(self, i, j):
-		""" return entries at specified span """
-		return self.row[i:j]
+		""" return a view of the specified span """
+		return SliceView(self, slice(i, j))
 
 	def __iter__(self):
 		"""	allow for iteration over this object
@@ -77,6 +82,19 @@ class Row(object):
 		"""
 		del self.row[index]
 
+	def resize(self, size, default=""):
+		""" pad the row with default cells, or truncate it, to size cells
+			in one step
+			@param	size: new number of cells
+			@param	default: value of added cells
+		"""
+		difference = size-len(self.row)
+
+		if difference < 0:
+			del self.row[size:]
+		elif difference > 0:
+			self.row.extend([Cell(default) for cell in xrange(difference)])
+
 	def reset(self, default=""):
 		""" reset all cells 
 			@param default: default value to reset cells with
@@ -0,0 +1,157 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Name:     RowView.py
+# Version:  1.0.0
+# Author:   Glenn Abastillas
+# Date:     October 18, 2026
+
+from Cell import BoundCell, Cell
+from SliceView import SliceView
+
+class RowView(object):
+	""" One row of a list of Column objects. Nothing is copied: reads and
+		writes go to the columns. Row 0 holds the column names.
+	"""
+
+	__slots__ = ('columns', 'row_index', 'sep')
+
+	def __init__(self, columns, row_index=0, sep="\t"):
+		""" Initialize an instance of this class
+			@param	columns: list of Column objects
+			@param	row_index: row of the columns to view; 0 is the names
+			@param	sep: separator used by toString()
+		"""
+		self.columns = columns
+		self.row_index = row_index
+		self.sep = sep
+
+	def __getitem__(self, i):
+		""" return item at specified index, or a view of a slice """
+		if isinstance(i, slice):
+			return SliceView(self, i)
+
+		value = self.get_value(i)
+
+		if i < 0:
+			i += len(self)
+
+		# Setting the cell writes through to the column, as set() does
+		return BoundCell(self, i, value)
+
+	def __getslice__(self, i, j):
+		""" return a view of the specified span """
+		return SliceView(self, slice(i, j))
+
+	def __iter__(self):
+		""" allow for iteration over this object """
+		for c in xrange(len(self)):
+			yield self[c]
+
+	def __len__(self):
+		""" return row size """
+		return len(self.columns)
+
+	def __setitem__(self, i, value):
+		""" set value of specified cell """
+		self.set(i, value)
+
+	def __str__(self):
+		""" return string representation of row """
+		return self.sep.join(str(self.get_value(c)) for c in xrange(len(self)))
+
+	def get(self, index):
+		""" return cell object at index
+			@param	index: position of cell to return
+		"""
+		return self[index]
+
+	def get_value(self, index):
+		""" return raw value at index, without wrapping it in a Cell
+			@param	index: position of value to return
+		"""
+		column = self.columns[index]
+
+		if self.row_index == 0:
+			return column.get_name()
+
+		# Short columns read as blank, as a padded Row would
+		if self.row_index > len(column):
+			return ""
+
+		return column.get_value(self.row_index-1)
+
+	def get_row_index(self):
+		""" return row_index attribute """
+		return self.row_index
+
+	def set(self, index, value):
+		""" set cell value at specified index """
+		column = self.columns[index]
+
+		if self.row_index == 0:
+			column.set_name(Cell.raw(value))
+		else:
+			column.set(self.row_index-1, value)
+
+	def toString(self, sep="\t"):
+		""" return string representation of row """
+		self.sep = sep
+		return str(self)
+
+class RowsView(object):
+	""" The rows of a list of Column objects, as RowView objects made when
+		they are read. Row 0 holds the column names.
+	"""
+
+	__slots__ = ('columns', 'sep')
+
+	def __init__(self, columns, sep="\t"):
+		""" Initialize an instance of this class
+			@param	columns: list of Column objects
+			@param	sep: separator of each row's toString()
+		"""
+		self.columns = columns
+		self.sep = sep
+
+	def __getitem__(self, i):
+		""" return RowView of specified row """
+		if isinstance(i, slice):
+			return [self[r] for r in xrange(*i.indices(len(self)))]
+
+		if i < 0:
+			i += len(self)
+
+		if not 0 <= i < len(self):
+			raise IndexError("row index out of range")
+
+		return RowView(self.columns, i, self.sep)
+
+	def __getslice__(self, i, j):
+		""" return rows at specified span """
+		return self[slice(i, j)]
+
+	def __iter__(self):
+		""" allow for iteration over this object """
+		for r in xrange(len(self)):
+			yield RowView(self.columns, r, self.sep)
+
+	def __len__(self):
+		""" return number of rows, including the column names """
+		if not self.columns:
+			return 0
+		return len(max(self.columns, key=len))+1
+
+if __name__ == '__main__':
+	from Column import Column
+
+	columns = [Column("a", 2, 1), Column("b", 2, "x")]
+	rows = RowsView(columns)
+
+	rows[1][1] = "y"
+	rows[0].set(0, "A")
+
+	for row in rows:
+		print str(row)
+
+	print len(rows), rows[-1][0], columns[1][0]
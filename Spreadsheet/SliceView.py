@@ -0,0 +1,93 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Name:     SliceView.py
+# Version:  1.0.0
+# Author:   Glenn Abastillas
+# Date:     October 18, 2026
+
+class SliceView(object):
+	""" A range of cells of a Row, Column or RowView. Nothing is copied:
+		reads and writes go to the parent. Use list() for a copy.
+	"""
+
+	__slots__ = ('parent', 'start', 'stop', 'step')
+
+	def __init__(self, parent, span=slice(None)):
+		""" Initialize an instance of this class
+			@param	parent: Row, Column, RowView or SliceView to view
+			@param	span: slice of the parent's cells, fixed against the
+					parent's length when the view is made
+		"""
+		self.parent = parent
+		self.start, self.stop, self.step = span.indices(len(parent))
+
+	def __getitem__(self, i):
+		""" return item at specified index, or a view of a slice """
+		if isinstance(i, slice):
+			return SliceView(self, i)
+		return self.parent[self.position(i)]
+
+	def __getslice__(self, i, j):
+		""" return a view of the specified span """
+		return SliceView(self, slice(i, j))
+
+	def __iter__(self):
+		""" allow for iteration over this object """
+		parent = self.parent
+
+		for i in xrange(self.start, self.stop, self.step):
+			yield parent[i]
+
+	def __len__(self):
+		""" return number of cells in view """
+		return len(xrange(self.start, self.stop, self.step))
+
+	def __setitem__(self, i, value):
+		""" set value of specified cell in the parent """
+		self.parent[self.position(i)] = value
+
+	def __str__(self):
+		""" return string representation of view """
+		return self.sep.join(str(cell) for cell in self)
+
+	@property
+	def sep(self):
+		""" return the parent's separator """
+		return self.parent.sep
+
+	def get(self, index):
+		""" return cell object at index
+			@param	index: position of cell in this view
+		"""
+		return self[index]
+
+	def position(self, index):
+		""" return the parent's index of a cell of this view
+			@param	index: position of cell in this view
+		"""
+		size = len(self)
+
+		if index < 0:
+			index += size
+
+		if not 0 <= index < size:
+			raise IndexError("view index out of range")
+
+		return self.start + index*self.step
+
+	def set(self, index, value):
+		""" set cell value at specified index """
+		self[index] = value
+
+if __name__ == '__main__':
+	from Column import Column
+
+	c = Column("test", 6, 0)
+	v = c[1:5]
+	v[0] = "a"
+	v[-1] = "z"
+	v[::2][1] = "m"
+
+	print str(c)
+	print len(v), v[0], str(v), [str(cell) for cell in c[::-2]]
@@ -5,9 +5,22 @@
 # Version:  1.0.0
 # Author:   Glenn Abastillas
 # Date:     August 28, 2016
-
-from Row import Row
+#
+# Updates:
+# 1. [2026/10/18] open() builds each column from the parsed data in one pass.
+#                 The header is no longer also written to the last cell.
+# 2. [2026/10/18] cells are kept once, in self.columns. In row orientation
+#                 self.spreadsheet is a RowsView of the columns, so to_cols()
+#                 and to_rows() copy nothing and edits need no flip.
+# 3. [2026/10/18] refresh() pads each short column with one resize().
+# 4. [2026/10/18] open() passes each column's cells to Column without first
+#                 slicing off the name.
+
+from itertools import islice, izip_longest
+
+from Cell import Cell
 from Column import Column
+from RowView import RowsView
 
 class Spreadsheet(object):
 
@@ -17,7 +30,8 @@ class Spreadsheet(object):
 		self.as_cols = True
 
 		self.attributes = dict([(attribute, kwargs[attribute]) if attribute in kwargs else (attribute, None) for attribute in attributes])
-		self.spreadsheet = list()
+		self.columns = list()
+		self.spreadsheet = self.columns
 
 		if self.attributes['sep'] is None:
 			self.attributes['sep']="\t"
@@ -35,114 +49,82 @@ class Spreadsheet(object):
 		return "\n".join(str(c) for c in self.spreadsheet)
 
 	def add_col(self, name="blank_column", fill=""):
-
-		prior_as_cols_state = self.as_cols
-		self.to_cols()
-
-		self.spreadsheet.append(Column(name,self.attributes['rows'],fill))
+		self.columns.append(Column(name,self.attributes['rows'],fill,column_index=len(self.columns)))
 
 		self.attributes['cols'] += 1
 
-		if prior_as_cols_state != self.as_cols:
-			self.to_rows()
-
 	def add_row(self, fill=""):
-
-		prior_as_cols_state = self.as_cols
-		self.to_rows()
-		
-		self.spreadsheet.append(Row(self.attributes['cols'],fill,sep=self.attributes['sep']))
+		for col in self.columns:
+			col.add(fill)
 
 		self.attributes['rows'] += 1
 
-		if prior_as_cols_state != self.as_cols:
-			self.to_cols()
-
 	def add_to_col(self, index, value):
-		prior_as_cols_state = self.as_cols
-
-		self.to_cols()
-		self.spreadsheet[index].add(value)
+		self.columns[index].add(value)
 		self.refresh()
-
-		if prior_as_cols_state != self.as_cols:
-			self.to_rows()
 	
 	def add_to_row(self, index, value):
+		""" append a cell to a row. Rows all have one cell per column, so
+			this adds a blank column holding value in the given row.
+			@param	index: row to add to; 0 is the column names
+			@param	value: value of the new cell
+		"""
+		col = Column("", len(max(self.columns, key=len)), column_index=len(self.columns))
 
-		prior_as_cols_state = self.as_cols
-
-		self.to_rows()
-		self.spreadsheet[index].add(value)
-
-		max_len = len(max(self.spreadsheet, key=len))
-
-		for row in self.spreadsheet:
+		if index == 0:
+			col.set_name(Cell.raw(value))
+		else:
+			col.set(index-1, value)
 
-			if len(row) < max_len:
-				difference = max_len - len(row)
-
-				for extra_cell in xrange(difference):
-					row.add("")
+		self.columns.append(col)
 
 		self.attributes['cols'] += 1
 
-		if prior_as_cols_state != self.as_cols:
-			self.to_cols()
-
 	def open(self, file_path, sep="\t"):
+		""" load a file, its first line being the column names
+			@param	file_path: file to load
+			@param	sep: cell separator
+		"""
 		with open(file_path, 'r') as file_in:
 			text = [line.split(sep) for line in file_in.read().splitlines() if len(line)>0]
 
-		self.attributes['cols'] = len(max(text, key=len))
-		self.attributes['rows'] = len(text)
+		# Transpose lines into columns, padding short lines with blank cells
+		columns = list(izip_longest(*text, fillvalue=""))
 
-		self.spreadsheet = [Column(name=text[0][c], size=self.attributes['rows']) for c in xrange(self.attributes['cols'])]
+		self.attributes['cols'] = len(columns)
+		self.attributes['rows'] = len(text)-1
 
-		for i, row in enumerate(text):
-			for j, attribute in enumerate(row):
-				self.spreadsheet[j].set(i-1, attribute)
-
-	def refresh(self):
-		max_len = len(max(self.spreadsheet, key=len))
+		self.columns = [Column(name=column[0], column_index=c, values=islice(column, 1, None)) for c, column in enumerate(columns)]
+		self.orient()
 
+	def orient(self):
+		""" point self.spreadsheet at the columns, or at a view of their rows """
 		if self.as_cols:
-			for col in self.spreadsheet:
+			self.spreadsheet = self.columns
+		else:
+			self.spreadsheet = RowsView(self.columns, self.attributes['sep'])
 
-				if len(col) < max_len:
-					difference = max_len - len(col)
+	def refresh(self):
+		""" pad columns with blank cells to the length of the longest one """
+		max_len = len(max(self.columns, key=len))
+
+		for col in self.columns:
 
-					for extra_cell in xrange(difference):
-						col.add("")
+			if len(col) < max_len:
+				col.resize(max_len, "")
 
-			self.attributes['rows'] += 1
+		self.attributes['rows'] = max_len
 
 
 	def to_cols(self):
 		if not self.as_cols:
-			transposed_spreadsheet = [Column(name=str(self.spreadsheet[0][c]), size=self.attributes['rows']) for c in xrange(self.attributes['cols'])]
-
-			for i,r in enumerate(self.spreadsheet[1:]):
-
-				for j,c in enumerate(r):
-
-					transposed_spreadsheet[j].set(i,c)
-
-			self.spreadsheet = transposed_spreadsheet
 			self.as_cols = not self.as_cols
+			self.orient()
 
 	def to_rows(self):
 		if self.as_cols:
-			transposed_spreadsheet = [Row(self.attributes['cols']) for r in xrange(self.attributes['rows']+1)]
-
-			for i,c in enumerate(self.spreadsheet):
-
-				for j,r in enumerate([c.get_name()]+c[:]):
-
-					transposed_spreadsheet[j].set(i,r)
-
-			self.spreadsheet = transposed_spreadsheet
 			self.as_cols = not self.as_cols
+			self.orient()
 
 	def save(self, name="Spreadsheet_object", extension="txt", path="."):
 		if self.attributes['save'] is not None:
@@ -21,6 +21,10 @@
 # 1. [2015/12/03] added "savePath" variable to save() function.
 # 2. [2015/12/04] optimized processes for speed, added saveFile() method.
 # 3. [2015/12/07] optimized name creation in save() method.
+# 4. [2026/10/18] added "where" filter to initializePlus(). Lines are streamed
+#                 and rows that fail the filter are never split.
+# 5. [2026/10/18] added joinPlus() to join spreadsheet and spreadsheetPlus.
+# 6. [2026/10/18] added "quoted" option to initializePlus() for quoted cells.
 # - - - - - - - - - - - - -
 """ create a Spreadsheet object for two spreadsheet inputs that enables the user to manipulate both
 
@@ -37,6 +41,7 @@ __email__       = "a5rjqzz@mmm.com"
 __status__      = "Deployed"
 
 from Spreadsheet import Spreadsheet
+from ColumnStore import TransposedView
 
 class SpreadsheetPlus(Spreadsheet):
 
@@ -63,18 +68,38 @@ class SpreadsheetPlus(Spreadsheet):
 		if filePath2 is not None:
 			self.initializePlus(filePath2)
 	
-	def initializePlus(self, filePath=None, sep="\t"):
+	def initializePlus(self, filePath=None, sep="\t", where=None, quoted=False):
 		""" Open the file and parse out rows and columns
 			@param	filePath: spreadsheet file to load into memory
+			@param	sep: delimiter of document at filePath
+			@param	where: keep only the header and the rows passing this filter,
+					a function of the raw line or a dict of column --> value(s).
+					See Spreadsheet.lineFilter()
+			@param	quoted: parse cells quoted with '"' that may hold sep or line
+					breaks. See Spreadsheet.iterQuotedRows()
 		"""
-		openedFilePath = self.open(filePath).splitlines()
-
-		for line in openedFilePath:
-			self.spreadsheetPlus.append(line.split(sep))
+		self.spreadsheetPlus.extend(self.iterRows(filePath, sep, where=where,
+												  quoted=quoted))
 
 		self.filePath2 	= filePath
 		self.loadedPlus	= True
 
+	def joinPlus(self, on, how="inner", otherOn=None):
+		""" Join spreadsheet to spreadsheetPlus on key columns. See Spreadsheet.join()
+			@param	on: key column(s) of spreadsheet
+			@param	how: 'inner', 'left' or 'anti'
+			@param	otherOn: key column(s) of spreadsheetPlus (same as on if None)
+			@return	new Spreadsheet with the joined rows
+		"""
+		# Join needs spreadsheetPlus as rows. A transposed spreadsheetPlus is
+		# a view over its rows, so read them without changing its state
+		rows = self.spreadsheetPlus
+
+		if isinstance(rows, TransposedView):
+			rows = rows.transpose()
+
+		return self.join(list(rows), on, how, otherOn)
+
 	def toStringPlus(self, fileToString=None):
 		""" Print out the input to screen
 			@param	fileToString: string to print
@@ -115,29 +140,14 @@ class SpreadsheetPlus(Spreadsheet):
 
 		# If 2, transpose the spreadsheet from filePath2
 		elif sheet == 2:
-			temporary_spreadsheet = list()
-			
-			# CALL THESE JUST ONCE BEFORE LOOP(S)
-			append = temporary_spreadsheet.append
-			longest_row = len(max(self.spreadsheetPlus, key=len))
 
-			# Loop through the longest row (if transposedPlus=False) or column (if transposedPlus=True)
-			for index in xrange(longest_row):
-
-				# At this index, insert a list for the new row/column
-				append(list())
-
-				# CALL THESE JUST ONCE BEFORE LOOP(S)
-				append2 = temporary_spreadsheet[index].append
-
-				# Loop through the lines of spreadsheetPlus to transpose rows and columns
-				for line in self.spreadsheetPlus:
-					try:
-						append2(line[index])
-					except(IndexError):
-						append2("")
+			# Swap rows and columns with a view instead of copying every cell.
+			# Transposing the view again returns the original lists.
+			if isinstance(self.spreadsheetPlus, TransposedView):
+				self.spreadsheetPlus = self.spreadsheetPlus.transpose()
+			else:
+				self.spreadsheetPlus = TransposedView(self.spreadsheetPlus)
 
-			self.spreadsheetPlus = temporary_spreadsheet
 			self.transposedPlus	 = not(self.transposedPlus)
 
 		# If 3, transpose both spreadsheets (i.e., filePath1, filePath2)
@@ -0,0 +1,105 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Name:     benchmark_cache.py
+# Version:  1.0.0
+# Author:   Glenn Abastillas
+# Date:     October 18, 2026
+#
+# Purpose: Times Spreadsheet.load() parsing a file, load(cache=True) when it
+#          must parse the file and write the cache (cold), and load(cache=True)
+#          reading a fresh cache (warm).
+#
+# Usage:   python benchmarks/benchmark_cache.py [--rows 100000 1000000]
+#              [--repeats 3]
+# - - - - - - - - - - - - -
+"""
+    Benchmark for ColumnCache.py through Spreadsheet.load(cache=True)
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir)
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from common import data_file
+from ColumnCache import ColumnCache
+from Spreadsheet import Spreadsheet
+
+# Default numbers of data rows
+SIZES = [100000, 1000000]
+
+
+def remove_cache(path):
+    cache = ColumnCache.path(path)
+
+    if os.path.exists(cache):
+        os.remove(cache)
+
+
+def load_parse(path):
+    Spreadsheet().load(path)
+
+
+def load_cold(path):
+    remove_cache(path)
+    Spreadsheet().load(path, cache=True)
+
+
+def load_warm(path):
+    Spreadsheet().load(path, cache=True)
+
+
+# name --> function loading path
+LOADERS = [
+    ("parse", load_parse),
+    ("cold", load_cold),
+    ("warm", load_warm),
+]
+
+
+def main(arguments=None):
+    """
+        Times each loader at each size and prints the best of the repeats,
+        and the speedup of a warm load over parsing
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, nargs="+", default=SIZES)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--data", default=tempfile.gettempdir(),
+                        help="directory for the synthetic files")
+    arguments = parser.parse_args(arguments)
+
+    for rows in arguments.rows:
+        path = data_file(arguments.data, rows)
+        times = dict()
+
+        for name, function in LOADERS:
+            results = list()
+
+            for i in xrange(arguments.repeats):
+                start = time.time()
+                function(path)
+                results.append(time.time() - start)
+
+            times[name] = min(results)
+            print("{0:>8} {1:<6} {2:>9.4f}s".format(rows, name, times[name]))
+
+        print("{0:>8} {1:<6} {2:>9.1f}x".format(rows, "warm",
+                                                times["parse"] / times["warm"]))
+
+        cache = ColumnCache.path(path)
+        print("{0:>8} {1:<6} {2:>9} KB file, {3} KB cache".format(
+            rows, "size", os.path.getsize(path) // 1024,
+            os.path.getsize(cache) // 1024))
+
+        remove_cache(path)
+
+
+if __name__ == "__main__":
+    main()
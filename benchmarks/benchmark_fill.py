@@ -0,0 +1,72 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Name:     benchmark_fill.py
+# Version:  1.0.0
+# Author:   Glenn Abastillas
+# Date:     October 18, 2026
+#
+# Purpose: Compares the time taken by Spreadsheet.fill() to build a column of
+#          formulas with the per-row cellList loop and with the bulk offsets
+#          mode.
+#
+# Usage:   python benchmarks/benchmark_fill.py [rows] [repeats]
+# - - - - - - - - - - - - -
+"""
+    Times Spreadsheet.fill(cellList=...) against Spreadsheet.fill(offsets=...)
+    on a synthetic spreadsheet.
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                os.pardir))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from common import HEADERS
+from common import rows as synthetic_rows
+from Spreadsheet import Spreadsheet
+
+
+def build(rows):
+    """
+        Returns the synthetic spreadsheet with the specified number of data
+        rows and a blank formula column
+    """
+    sheet = Spreadsheet(columns=HEADERS + ["formula"])
+    sheet.spreadsheet.extend(cells + [""] for cells in synthetic_rows(rows))
+    return sheet
+
+
+def main(rows=100000, repeats=3):
+    """
+        Prints the best time of each fill mode
+    """
+    sheet = build(rows)
+
+    def loop():
+        sheet.fill("formula", cellList=[("$A{0}", 1)])
+
+    def bulk():
+        sheet.fill("formula", "$A{0}", offsets=[1])
+
+    # Both modes must produce the same column
+    loop()
+    expected = sheet.column("formula")
+    bulk()
+    assert sheet.column("formula") == expected
+
+    loop_time = min(timeit.repeat(loop, number=1, repeat=repeats))
+    bulk_time = min(timeit.repeat(bulk, number=1, repeat=repeats))
+
+    print("rows: {0}".format(rows))
+    print("cellList loop: {0:.4f}s".format(loop_time))
+    print("offsets bulk:  {0:.4f}s".format(bulk_time))
+    print("speedup:       {0:.1f}x".format(loop_time / bulk_time))
+
+
+if __name__ == "__main__":
+    arguments = [int(argument) for argument in sys.argv[1:3]]
+    main(*arguments)
@@ -0,0 +1,120 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Name:     benchmark_package_memory.py
+# Version:  1.0.0
+# Author:   Glenn Abastillas
+# Date:     October 18, 2026
+#
+# Purpose: Measures the memory held by the cells of the Spreadsheet package's
+#          Column class: one Cell object with a __dict__ per value (the old
+#          layout), one slotted Cell per value, a Column of raw values, and a
+#          Column packed into an array.
+#
+# Usage:   python benchmarks/benchmark_package_memory.py [--cells 1000000]
+#
+# Each layout is built in its own child process from the score column of the
+# synthetic spreadsheet in common.py, so the time includes generating it. kb
+# is the growth of resident memory while the cells are built and held.
+# - - - - - - - - - - - - -
+"""
+    Memory benchmark for Spreadsheet/Cell.py and Spreadsheet/Column.py
+"""
+
+import argparse
+import multiprocessing
+import os
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir)
+sys.path.insert(0, os.path.join(ROOT, "Spreadsheet"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from common import HEADERS, LegacyCell, peak, reset_peak, rows, rss
+from Cell import Cell
+from Column import Column
+
+# Default number of cells
+CELLS = 1000000
+
+
+SCORE = HEADERS.index("score")
+
+
+def values(cells):
+    # The score column of the synthetic spreadsheet, one value per cell
+    return (float(row[SCORE]) for row in rows(cells))
+
+
+def build_legacy(cells):
+    return [LegacyCell(value) for value in values(cells)]
+
+
+def build_slotted(cells):
+    return [Cell(value) for value in values(cells)]
+
+
+def build_column(cells):
+    column = Column(size=0)
+    column.set_column(values(cells))
+    return column
+
+
+def build_array(cells):
+    # Fill the array directly so no list of floats is held on the way
+    column = Column(size=0, typecode='d')
+    column.get_values().extend(values(cells))
+    return column
+
+
+# name --> function building the cells
+LAYOUTS = [
+    ("Cell with __dict__", build_legacy),
+    ("Cell with __slots__", build_slotted),
+    ("Column of values", build_column),
+    ("Column array('d')", build_array),
+]
+
+
+def measure(function, cells, queue):
+    """
+        Builds cells in this (child) process and puts the memory they hold
+        on queue
+    """
+    baseline = rss()
+    reset_peak()
+
+    start = time.time()
+    held = function(cells)
+    seconds = time.time() - start
+
+    queue.put({"seconds": seconds,
+               "kb": max(rss() - baseline, 0),
+               "peak_kb": max(peak() - baseline, 0)})
+    del held
+
+
+def main(arguments=None):
+    """
+        Builds each layout and prints the memory it holds
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--cells", type=int, default=CELLS)
+    arguments = parser.parse_args(arguments)
+
+    for name, function in LAYOUTS:
+        queue = multiprocessing.Queue()
+        process = multiprocessing.Process(target=measure,
+                                          args=(function, arguments.cells,
+                                                queue))
+        process.start()
+        result = queue.get()
+        process.join()
+
+        print("{0:<20} {1:>9.4f}s {2:>10} KB {3:>10} KB peak".format(
+            name, result["seconds"], result["kb"], result["peak_kb"]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Name:     benchmark_package_open.py
+# Version:  1.0.0
+# Author:   Glenn Abastillas
+# Date:     October 18, 2026
+#
+# Purpose: Times Spreadsheet.open() from the Spreadsheet package, which builds
+#          each column from the parsed file in one pass, against the per-cell
+#          loop it replaced, run on columns of Cell objects as it was then.
+#
+# Usage:   python benchmarks/benchmark_package_open.py [--rows 10000 100000]
+#              [--repeats 3]
+# - - - - - - - - - - - - -
+"""
+    Benchmark for Spreadsheet/Spreadsheet.py open()
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+# The package's Spreadsheet.py, not the top-level one
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir)
+sys.path.insert(0, os.path.join(ROOT, "Spreadsheet"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from common import LegacyCell, data_file
+from Spreadsheet import Spreadsheet
+
+# Default numbers of data rows
+SIZES = [10000, 100000]
+
+
+class LegacyColumn(object):
+
+    """
+        Column as it was before cells were stored raw: one Cell object per
+        cell, written with Cell.set()
+    """
+
+    def __init__(self, name="column", size=1, default=""):
+        self.column_name = name
+        self.column = [LegacyCell(default) for i in xrange(size)]
+
+    def __len__(self):
+        return len(self.column)
+
+    def set(self, index, value):
+        self.column[index].set(value)
+
+
+def open_per_cell(sheet, file_path, sep="\t"):
+    """
+        open() before the bulk path: prefilled columns of Cell objects, then
+        one set() per cell. Row 0 is written to index -1.
+    """
+    with open(file_path, 'r') as file_in:
+        text = [line.split(sep) for line in file_in.read().splitlines()
+                if len(line) > 0]
+
+    sheet.attributes['cols'] = len(max(text, key=len))
+    sheet.attributes['rows'] = len(text)
+
+    sheet.spreadsheet = [LegacyColumn(name=text[0][c],
+                                      size=sheet.attributes['rows'])
+                         for c in xrange(sheet.attributes['cols'])]
+
+    for i, row in enumerate(text):
+        for j, attribute in enumerate(row):
+            sheet.spreadsheet[j].set(i - 1, attribute)
+
+
+def open_bulk(sheet, file_path, sep="\t"):
+    sheet.open(file_path, sep)
+
+
+# name --> function loading a file into a sheet
+LOADERS = [
+    ("per-cell", open_per_cell),
+    ("bulk", open_bulk),
+]
+
+
+def main(arguments=None):
+    """
+        Times each loader at each size and prints the best of the repeats
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, nargs="+", default=SIZES)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--data", default=tempfile.gettempdir(),
+                        help="directory for the synthetic files")
+    arguments = parser.parse_args(arguments)
+
+    sheet = Spreadsheet()
+
+    for rows in arguments.rows:
+        path = data_file(arguments.data, rows)
+
+        for name, function in LOADERS:
+            times = list()
+
+            for i in xrange(arguments.repeats):
+                start = time.time()
+                function(sheet, path)
+                times.append(time.time() - start)
+
+            print("{0:>8} {1:<10} {2:>9.4f}s".format(rows, name, min(times)))
+
+
+if __name__ == "__main__":
+    main()
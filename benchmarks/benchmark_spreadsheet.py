@@ -0,0 +1,203 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Name:     benchmark_spreadsheet.py
+# Version:  1.0.0
+# Author:   Glenn Abastillas
+# Date:     October 18, 2026
+#
+# Purpose: Times the main operations of the Spreadsheet class on synthetic
+#          tab-separated files and records wall time and peak memory in a
+#          JSON file, so runs can be compared across commits.
+#
+# Usage:   python benchmarks/benchmark_spreadsheet.py
+#              [--rows 10000 100000 1000000] [--operations load sort ...]
+#              [--repeats 1] [--output results.json]
+#
+# Each operation runs in its own child process, so the peak memory reported
+# for one operation is not affected by the others. peak_kb is the growth of
+# resident memory above what the process held before the operation started.
+# - - - - - - - - - - - - -
+"""
+    Benchmark suite for Spreadsheet.py
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir)
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from common import data_file, peak, reset_peak, rss
+from Spreadsheet import Spreadsheet
+
+# Default numbers of data rows
+SIZES = [10000, 100000, 1000000]
+
+# Number of lookups timed by the getColumnIndex benchmark
+LOOKUPS = 10000
+
+def loaded(path):
+    """
+        Returns a Spreadsheet loaded from path
+    """
+    return Spreadsheet(path)
+
+
+def run_getColumnIndex(sheet):
+    for i in xrange(LOOKUPS):
+        sheet.getColumnIndex("score")
+
+
+def run_save(sheet):
+    handle, path = tempfile.mkstemp(suffix=".tsv")
+    os.close(handle)
+
+    try:
+        sheet.save(path)
+    finally:
+        os.remove(path)
+
+
+def run_transpose(sheet):
+    sheet.transpose()
+    sheet.transpose()
+
+
+# name --> (setup function, timed function)
+OPERATIONS = [
+    ("load", (lambda path: path), loaded),
+    ("transpose", loaded, run_transpose),
+    ("column", loaded, lambda sheet: sheet.column("note")),
+    ("getColumnIndex", loaded, run_getColumnIndex),
+    ("sort", loaded, lambda sheet: sheet.sort("count")),
+    ("fill", loaded, lambda sheet: sheet.fill("note", "x")),
+    ("newColumn", loaded, lambda sheet: sheet.newColumn("new", "")),
+    ("prepareForSave", loaded, lambda sheet: sheet.prepareForSave()),
+    ("save", loaded, run_save),
+    ("toString", loaded, lambda sheet: sheet.toString()),
+]
+
+
+def measure(setup, function, path, queue):
+    """
+        Runs function in this (child) process and puts its wall time and
+        peak memory on queue
+
+        Attributes:
+            setup (function): prepares the argument for function from path
+            function (function): operation to time
+            path (str): synthetic spreadsheet file
+            queue (Queue): queue to put results on
+    """
+    try:
+        argument = setup(path)
+        baseline = rss()
+        reset_peak()
+
+        start = time.time()
+        function(argument)
+        seconds = time.time() - start
+
+        queue.put({"seconds": seconds,
+                   "peak_kb": max(peak() - baseline, 0),
+                   "baseline_kb": baseline})
+
+    except Exception as error:
+        queue.put({"error": repr(error)})
+
+
+def benchmark(name, setup, function, path, repeats):
+    """
+        Returns the best result of an operation over repeated runs
+    """
+    results = list()
+
+    for i in xrange(repeats):
+        queue = multiprocessing.Queue()
+        process = multiprocessing.Process(target=measure,
+                                          args=(setup, function, path, queue))
+        process.start()
+        result = queue.get()
+        process.join()
+
+        if "error" in result:
+            return result
+
+        results.append(result)
+
+    return min(results, key=lambda result: result["seconds"])
+
+
+def commit():
+    """
+        Returns the current git commit, or None outside a git checkout
+    """
+    try:
+        return subprocess.check_output(["git", "rev-parse", "HEAD"],
+                                       cwd=ROOT).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(arguments=None):
+    """
+        Runs the selected operations at each size and writes the results
+        to a JSON file named after the current commit unless --output is set
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, nargs="+", default=SIZES)
+    parser.add_argument("--operations", nargs="+",
+                        default=[name for name, s, f in OPERATIONS])
+    parser.add_argument("--repeats", type=int, default=1)
+    parser.add_argument("--output", default=None)
+    parser.add_argument("--data", default=tempfile.gettempdir(),
+                        help="directory for the synthetic files")
+    arguments = parser.parse_args(arguments)
+
+    revision = commit()
+    output = arguments.output
+
+    if output is None:
+        output = "benchmark-{0}.json".format((revision or "local")[:10])
+
+    report = {"commit": revision,
+              "python": platform.python_version(),
+              "platform": platform.platform(),
+              "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+              "results": list()}
+
+    for rows in arguments.rows:
+        path = data_file(arguments.data, rows)
+
+        for name, setup, function in OPERATIONS:
+            if name not in arguments.operations:
+                continue
+
+            result = benchmark(name, setup, function, path, arguments.repeats)
+            result.update({"operation": name, "rows": rows})
+            report["results"].append(result)
+
+            if "error" in result:
+                print("{0:>8} {1:<16} error: {2}".format(rows, name,
+                                                         result["error"]))
+            else:
+                print("{0:>8} {1:<16} {2:>9.4f}s {3:>10} KB".format(
+                    rows, name, result["seconds"], result["peak_kb"]))
+
+    with open(output, 'w') as fout:
+        json.dump(report, fout, indent=2, sort_keys=True)
+
+    print("results written to {0}".format(output))
+
+
+if __name__ == "__main__":
+    main()
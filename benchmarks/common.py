@@ -0,0 +1,126 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Name:     common.py
+# Version:  1.0.0
+# Author:   Glenn Abastillas
+# Date:     October 18, 2026
+#
+# Purpose: Helpers shared by the benchmarks: the synthetic spreadsheet every
+#          benchmark runs on, memory readings, and the Cell layout from before
+#          __slots__ for comparisons against the old code.
+# - - - - - - - - - - - - -
+"""
+    Helpers shared by the benchmarks
+"""
+
+import os
+import random
+import resource
+
+HEADERS = ["id", "site", "dice", "count", "score", "note"]
+WORDS = ["debridement", "excisional", "wound", "ulcer", "muscle", "bone",
+         "subcutaneous", "tissue", "skin", "fascia"]
+
+
+def rows(count, seed=0):
+    """
+        Yields the data rows of the synthetic spreadsheet: text, integer,
+        float and blank cells under HEADERS
+
+        Attributes:
+            count (int): number of data rows
+            seed (int): seed for the random number generator
+    """
+    generator = random.Random(seed)
+    choice = generator.choice
+    randint = generator.randint
+
+    for i in xrange(count):
+        yield [str(i),
+               "SITE{0:02d}".format(randint(0, 40)),
+               "CH{0:03d}".format(randint(0, 300)),
+               str(randint(0, 1000)) if randint(0, 9) else "",
+               "{0:.3f}".format(generator.random() * 100),
+               " ".join(choice(WORDS) for w in xrange(randint(1, 6)))]
+
+
+def generate(path, count, seed=0):
+    """
+        Writes the synthetic spreadsheet to a tab-separated file
+
+        Attributes:
+            path (str): file to write
+            count (int): number of data rows
+            seed (int): seed for the random number generator
+    """
+    with open(path, 'w') as fout:
+        fout.write("\t".join(HEADERS))
+
+        for cells in rows(count, seed):
+            fout.write("\n" + "\t".join(cells))
+
+
+def data_file(directory, count):
+    """
+        Returns the path of the synthetic spreadsheet with count data rows in
+        directory, writing it first if it does not exist
+    """
+    path = os.path.join(directory, "pydocs-benchmark-{0}.tsv".format(count))
+
+    if not os.path.exists(path):
+        generate(path, count)
+
+    return path
+
+
+def rss():
+    """
+        Returns current resident memory of this process in kilobytes
+    """
+    with open("/proc/self/statm") as statm:
+        pages = int(statm.read().split()[1])
+
+    return pages * resource.getpagesize() // 1024
+
+
+def reset_peak():
+    """
+        Resets the peak resident memory (VmHWM) of this process so that the
+        next reading covers only what follows. Returns False if the kernel
+        does not support it.
+    """
+    try:
+        with open("/proc/self/clear_refs", 'w') as clear_refs:
+            clear_refs.write("5")
+        return True
+    except (IOError, OSError):
+        return False
+
+
+def peak():
+    """
+        Returns peak resident memory of this process in kilobytes
+    """
+    with open("/proc/self/status") as status:
+        for line in status:
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1])
+
+    # ru_maxrss is in kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+class LegacyCell(object):
+
+    """
+        Cell as it was before __slots__: every instance has a __dict__
+    """
+
+    def __init__(self, value=None):
+        self.value = value
+        self.value_type = type(value)
+
+    def set(self, value=None):
+        self.value = value
+        self.value_type = type(value)